@@ -1,25 +1,86 @@
 """Agent module providing core functionality for AI agents with tool and context support."""
 
-import importlib.util
-import json
+import importlib
 import logging
 import os
-import sys
+import pkgutil
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, cast, runtime_checkable
+from typing import Any, Deque, Dict, Iterable, List, Optional, Protocol, Tuple, cast
 
+import orjson
 from litellm import completion
 
 from swarmer.globals.agent_registry import agent_registry
 from swarmer.globals.constitution import constitution
 from swarmer.swarmer_types import AgentBase, AgentContext, AgentIdentity, Message, Tool
+from swarmer.tools.loader import load_tool_module, module_tool_names
 from swarmer.tools.utils import ToolResponse
 
+logger = logging.getLogger(__name__)
+
 T = Any
 
+# Shared pool for running the read-only tool calls from a single LLM turn concurrently
+_TOOL_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("SWARMER_TOOL_WORKERS", "8")),
+    thread_name_prefix="swarmer-tool",
+)
+
+# Maximum number of messages kept in an agent's message log
+_MAX_HISTORY_MESSAGES = int(os.getenv("SWARMER_HISTORY_MAX", "200"))
+
+_CONTEXTS_DIR = Path(__file__).parent / "contexts"
+_CONTEXT_MODULE_CACHE: Dict[str, str] = {}
+_CONTEXT_CLASS_CACHE: Dict[str, type] = {}
+_CONTEXT_CACHE_MTIME: Optional[float] = None
+
+
+def _get_context_class(context_class_name: str) -> type:
+    """Resolve a context class shipped in ``swarmer.contexts`` by its name.
+
+    The contexts directory is scanned once (again only when it changes) to map
+    class names to modules, and only the module defining the requested class
+    is imported. This keeps heavy dependencies of unused contexts out of
+    ``load_state``.
+
+    Args:
+        context_class_name: The class name of the context, e.g. "MemoryContext".
+
+    Returns:
+        The context class.
+
+    Raises:
+        KeyError: If no context module defines the requested class.
+    """
+    global _CONTEXT_CACHE_MTIME
+
+    mtime = _CONTEXTS_DIR.stat().st_mtime
+    if mtime != _CONTEXT_CACHE_MTIME:
+        _CONTEXT_MODULE_CACHE.clear()
+        _CONTEXT_CLASS_CACHE.clear()
+        for module_info in pkgutil.iter_modules([str(_CONTEXTS_DIR)]):
+            if module_info.name.endswith("_context"):
+                class_name = "".join(
+                    word.capitalize() for word in module_info.name.split("_")
+                )
+                _CONTEXT_MODULE_CACHE[class_name] = (
+                    f"swarmer.contexts.{module_info.name}"
+                )
+        _CONTEXT_CACHE_MTIME = mtime
+
+    context_class = _CONTEXT_CLASS_CACHE.get(context_class_name)
+    if context_class is None:
+        module = importlib.import_module(_CONTEXT_MODULE_CACHE[context_class_name])
+        if not hasattr(module, context_class_name):
+            raise KeyError(context_class_name)
+        context_class = getattr(module, context_class_name)
+        _CONTEXT_CLASS_CACHE[context_class_name] = context_class
+    return context_class
+
 
-@runtime_checkable
 class ToolCall(Protocol):
     """A representation of a tool call from the LLM."""
 
@@ -39,6 +100,24 @@ class Agent(AgentBase):
     including message history and token usage.
     """
 
+    __slots__ = (
+        "identity",
+        "contexts",
+        "tools",
+        "token_budget",
+        "message_log",
+        "model",
+        "token_usage",
+        "_tools_version",
+        "_contexts_version",
+        "_schema_cache",
+        "_instructions_cache",
+        "_instructions_text_cache",
+        "_context_snapshot",
+        "_context_epoch",
+        "_message_log_version",
+    )
+
     @staticmethod
     def save_state(agent: "Agent", file_path: str) -> None:
         """Save agent state to file.
@@ -52,14 +131,14 @@ class Agent(AgentBase):
             "token_budget": agent.token_budget,
             "model": agent.model,
             "token_usage": agent.token_usage,
-            "message_log": [msg.dict() for msg in agent.message_log],
+            "message_log": [msg.model_dump() for msg in agent.message_log],
             "contexts": {
                 context.__class__.__name__: context.serialize()
                 for context in agent.contexts.values()
             },
         }
-        with open(file_path, "w") as f:
-            json.dump(state, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
 
     @staticmethod
     def load_state(file_path: str) -> "Agent":
@@ -71,8 +150,8 @@ class Agent(AgentBase):
         Returns:
             The loaded agent.
         """
-        with open(file_path, "r") as f:
-            state = json.load(f)
+        with open(file_path, "rb") as f:
+            state = orjson.loads(f.read())
 
         # Create new agent with basic params
         agent = Agent(
@@ -82,30 +161,17 @@ class Agent(AgentBase):
         )
         agent.identity.id = state["identity"]["id"]
         agent.token_usage = state["token_usage"]
-        agent.message_log = [Message(**msg) for msg in state["message_log"]]
+        agent.message_log.extend(Message(**msg) for msg in state["message_log"])
+        agent._message_log_version += 1
+        agent._trim_message_log()
 
         # Register agent in registry before deserializing contexts
         agent_registry.registry[agent.identity.id] = agent
 
-        # Import and instantiate contexts dynamically
-        import importlib
-        import pkgutil
-
-        context_classes = {}
-        for module_info in pkgutil.iter_modules(["swarmer/contexts"]):
-            if module_info.name.endswith("_context"):
-                module = importlib.import_module(f"swarmer.contexts.{module_info.name}")
-                context_class_name = "".join(
-                    word.capitalize() for word in module_info.name.split("_")
-                )
-                if hasattr(module, context_class_name):
-                    context_classes[context_class_name] = getattr(
-                        module, context_class_name
-                    )
-
-        # First register fresh contexts with the saved IDs
+        # First register fresh contexts with the saved IDs, importing only
+        # the context modules this state actually uses
         for context_name, context_state in state["contexts"].items():
-            context_class = context_classes[context_name]
+            context_class = _get_context_class(context_name)
             context = context_class()
             context.id = context_state["id"]  # Set the ID before registration
             agent.register_context(context)
@@ -135,13 +201,25 @@ class Agent(AgentBase):
         self.contexts: Dict[str, AgentContext] = {}
         self.tools: Dict[str, Tool] = {}
         self.token_budget = token_budget
-        self.message_log: List[Message] = []
+        self.message_log: Deque[Message] = deque()
         self.model = model
         self.token_usage: Dict[str, int] = {
             "prompt_tokens": 0,
             "completion_tokens": 0,
             "total_tokens": 0,
         }
+        # Bumped whenever tools/contexts change so derived data can be cached
+        self._tools_version = 0
+        self._contexts_version = 0
+        self._schema_cache: Optional[Tuple[int, List[dict]]] = None
+        self._instructions_cache: Optional[Tuple[int, List[str]]] = None
+        self._instructions_text_cache: Optional[Tuple[int, Dict[str, str]]] = None
+        # Immutable copy of the registered contexts for cheap iteration
+        self._context_snapshot: Tuple[AgentContext, ...] = ()
+        # Bumped whenever context state may have changed, see touch_context
+        self._context_epoch = 0
+        # Bumped whenever messages are added to or cleared from the message log
+        self._message_log_version = 0
         self.load_agent_tools()
 
     # -----
@@ -153,10 +231,37 @@ class Agent(AgentBase):
         Args:
             tool: The tool to register.
         """
-        logger = logging.getLogger(__name__)
-        logger.info(f"Registering tool '{tool.__name__}' for agent {self.identity.id}")
-        self.tools[tool.__name__] = tool
-        logger.info(f"Successfully registered tool '{tool.__name__}'")
+        tool_name = tool.__name__
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Registering tool '%s' for agent %s", tool_name, self.identity.id
+            )
+        self.tools[tool_name] = tool
+        self._tools_version += 1
+        if log_info:
+            logger.info("Successfully registered tool '%s'", tool_name)
+
+    def register_tools(self, tools: Iterable[Tool]) -> None:
+        """Register several tools with the agent at once.
+
+        The tools are added with a single dict update, so derived data such as
+        the tool schemas is only invalidated once.
+
+        Args:
+            tools: The tools to register.
+        """
+        new_tools = {tool.__name__: tool for tool in tools}
+        if not new_tools:
+            return
+        self.tools.update(new_tools)
+        self._tools_version += 1
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Registered tools %s for agent %s",
+                ", ".join(new_tools),
+                self.identity.id,
+            )
 
     def unregister_tool(self, tool_name: str) -> None:
         """Unregister a tool from the agent.
@@ -165,6 +270,7 @@ class Agent(AgentBase):
             tool_name: The name of the tool to unregister.
         """
         self.tools.pop(tool_name)
+        self._tools_version += 1
 
     # -----
     # Context
@@ -176,9 +282,11 @@ class Agent(AgentBase):
             context: The context to register.
         """
         self.contexts[context.id] = context
+        self._contexts_version += 1
+        self._context_snapshot = tuple(self.contexts.values())
+        self.touch_context()
         # Register tools
-        for tool in context.tools:
-            self.register_tool(tool)
+        self.register_tools(context.tools)
 
     def unregister_context(self, context_id: str) -> None:
         """Unregister a context from the agent.
@@ -187,6 +295,18 @@ class Agent(AgentBase):
             context_id: The ID of the context to unregister.
         """
         self.contexts.pop(context_id)
+        self._contexts_version += 1
+        self._context_snapshot = tuple(self.contexts.values())
+        self.touch_context()
+
+    def touch_context(self) -> None:
+        """Signal that the state reported by the agent's contexts may have changed.
+
+        Executing a tool that is not marked ``read_only`` does this automatically.
+        Call it after changing context state outside of a tool call, so that a
+        running tool-call loop picks up the change.
+        """
+        self._context_epoch += 1
 
     # -----
     # Run
@@ -200,57 +320,46 @@ class Agent(AgentBase):
         Returns:
             A list of messages representing the agent's response.
         """
-        logger = logging.getLogger(__name__)
         user_message = Message(role="user", content=user_input)
+        model = self.model
+        agent_id = self.identity.id
+        log_debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
-            # Get context and instructions
+            context_epoch = self._context_epoch
             context = self.get_context()
-            instructions = self.get_context_instructions()
-
-            # Build system message with context and instructions
-            system_content = constitution.instruction + "\n\n"
-            if context:
-                system_content += "Current context:\n" + "\n".join(context) + "\n\n"
-            if instructions:
-                system_content += "Instructions:\n" + "\n".join(instructions)
+            system_message = self._build_system_message(context)
+            context_messages = self._build_context_messages(context)
 
-            system_message = Message(role="system", content=system_content)
-
-            context_str = "\n\n".join(self.get_context())
-            context_message = Message(
-                role="system", content=f"Current context:\n\n{context_str}"
-            )
-
-            logger.debug(f"Making completion request for agent {self.identity.id}")
+            if log_debug:
+                logger.debug("Making completion request for agent %s", agent_id)
             response = completion(
-                model=self.model,
+                model=model,
                 messages=[
                     system_message,
                     *self.message_log,
-                    context_message,
+                    *context_messages,
                     user_message,
                 ],
                 tools=self.get_tool_schemas(),
             )
 
-            # Add token tracking
-            if response.usage:
-                self.token_usage["prompt_tokens"] += response.usage.prompt_tokens
-                self.token_usage[
-                    "completion_tokens"
-                ] += response.usage.completion_tokens
-                self.token_usage["total_tokens"] += response.usage.total_tokens
+            self._track_token_usage(response)
 
             message = response.choices[0].message
             response_history = [message]
 
+            # The conversation up to the user's message is fixed for this turn
+            follow_up_prefix = [system_message, *self.message_log, user_message]
+
             while response.choices[0].finish_reason == "tool_calls":
-                logger.debug(f"Processing tool calls for agent {self.identity.id}")
-                # TODO: handle in parallel
-                for tool_call in message.tool_calls:
+                if log_debug:
+                    logger.debug("Processing tool calls for agent %s", agent_id)
+                # Results are collected in call order to keep tool_call_id pairing
+                futures = self._submit_tool_calls(message.tool_calls)
+                for future, tool_call in zip(futures, message.tool_calls):
                     try:
-                        tool_result = self.execute_tool_call(tool_call)
+                        tool_result = future.result()
                         tool_result_message = Message(
                             role="tool",
                             content=tool_result,
@@ -259,7 +368,7 @@ class Agent(AgentBase):
                         )
                         response_history.append(tool_result_message)
                     except Exception as e:
-                        logger.error(f"Error executing tool call: {e}", exc_info=True)
+                        logger.error("Error executing tool call: %s", e, exc_info=True)
                         tool_result_message = Message(
                             role="tool",
                             content=f"Error executing tool: {str(e)}",
@@ -268,39 +377,160 @@ class Agent(AgentBase):
                         )
                         response_history.append(tool_result_message)
 
-                context_str = "\n\n".join(self.get_context())
-                context_message = Message(
-                    role="system", content=f"Current context:\n\n{context_str}"
-                )
+                # Only rebuild the context if a tool may have changed it
+                if self._context_epoch != context_epoch:
+                    context_epoch = self._context_epoch
+                    context_messages = self._build_context_messages(self.get_context())
 
-                logger.debug(
-                    f"Making follow-up completion request for agent {self.identity.id}"
-                )
+                if log_debug:
+                    logger.debug(
+                        "Making follow-up completion request for agent %s", agent_id
+                    )
                 response = completion(
-                    model=self.model,
-                    messages=[
-                        system_message,
-                        *self.message_log,
-                        user_message,
-                        context_message,
-                        *response_history,
-                    ],
+                    model=model,
+                    messages=follow_up_prefix + context_messages + response_history,
                     tools=self.get_tool_schemas(),
                 )
                 message = response.choices[0].message
                 response_history.append(message)
 
             self.message_log += [user_message, *response_history]
+            self._message_log_version += 1
+            self._trim_message_log()
             return response_history
 
         except Exception as e:
-            logger.error(f"Error in agent run loop: {e}", exc_info=True)
+            logger.error("Error in agent run loop: %s", e, exc_info=True)
             error_message = Message(
                 role="assistant",
                 content="I apologize, but I encountered an error processing your request. Please try again.",
             )
             return [error_message]
 
+    def run_loop_batch(self, user_inputs: List[str]) -> List[List[Message]]:
+        """Answer several independent user inputs with a single completion request.
+
+        The inputs share the system prompt and message history, so they are
+        enumerated in one prompt and the model is asked for a JSON array with one
+        reply per input. Tools are not offered in batched requests; if the reply
+        cannot be matched to the inputs, each input is run through ``run_loop``.
+
+        Args:
+            user_inputs: The user inputs to process.
+
+        Returns:
+            A list with the response messages for each input, in input order.
+        """
+        if len(user_inputs) < 2:
+            return [self.run_loop(user_input) for user_input in user_inputs]
+
+        enumerated_inputs = "\n\n".join(
+            f"Input {index}: {user_input}"
+            for index, user_input in enumerate(user_inputs, start=1)
+        )
+        batch_message = Message(
+            role="user",
+            content=(
+                "Reply to each of the following independent inputs.\n\n"
+                f"{enumerated_inputs}\n\n"
+                "Return a JSON array of strings where element j is your full reply "
+                "to Input j. Return only the JSON array."
+            ),
+        )
+
+        try:
+            context = self.get_context()
+
+            logger.debug(
+                "Making batched completion request for agent %s", self.identity.id
+            )
+            response = completion(
+                model=self.model,
+                messages=[
+                    self._build_system_message(context),
+                    *self.message_log,
+                    *self._build_context_messages(context),
+                    batch_message,
+                ],
+            )
+            self._track_token_usage(response)
+
+            content = response.choices[0].message.content or ""
+            # Models sometimes wrap the array in a markdown code fence
+            array_start, array_end = content.find("["), content.rfind("]") + 1
+            replies = orjson.loads(content[array_start:array_end])
+            if not isinstance(replies, list) or len(replies) != len(user_inputs):
+                raise ValueError(
+                    f"Expected {len(user_inputs)} replies, got: {content[:100]}"
+                )
+        except Exception as e:
+            logger.warning(
+                "Batched request failed, running inputs individually: %s",
+                e,
+                exc_info=True,
+            )
+            return [self.run_loop(user_input) for user_input in user_inputs]
+
+        results = []
+        for user_input, reply in zip(user_inputs, replies):
+            reply_message = Message(role="assistant", content=str(reply))
+            self.message_log += [
+                Message(role="user", content=user_input),
+                reply_message,
+            ]
+            results.append([reply_message])
+        self._message_log_version += 1
+        self._trim_message_log()
+        return results
+
+    def _build_system_message(self, context: List[str]) -> Message:
+        """Build the system message from the constitution and all contexts.
+
+        Args:
+            context: The current context strings, as returned by get_context.
+
+        Returns:
+            The system message for a completion request.
+        """
+        instructions = self.get_context_instructions_text()
+
+        system_content = constitution.instruction + "\n\n"
+        if context:
+            system_content += "Current context:\n" + "\n".join(context) + "\n\n"
+        if instructions:
+            system_content += "Instructions:\n" + instructions
+
+        return Message(role="system", content=system_content)
+
+    def _build_context_messages(self, context: List[str]) -> List[Message]:
+        """Build the context message sent right before the user's message.
+
+        Args:
+            context: The current context strings, as returned by get_context.
+
+        Returns:
+            A list holding the context message, or an empty list if there is no
+            context to send.
+        """
+        if not context:
+            return []
+
+        context_str = "\n\n".join(context)
+        return [Message(role="system", content=f"Current context:\n\n{context_str}")]
+
+    def _track_token_usage(self, response: Any) -> None:
+        """Add the token usage reported by a completion response to the totals.
+
+        Args:
+            response: The completion response.
+        """
+        usage = response.usage
+        if usage:
+            token_usage = self.token_usage
+            token_usage["prompt_tokens"] += usage.prompt_tokens
+            token_usage["completion_tokens"] += usage.completion_tokens
+            token_usage["total_tokens"] += usage.total_tokens
+
     def execute_tool(self, tool_name: str, **kwargs: Any) -> ToolResponse:
         """Execute a tool by name with given arguments.
 
@@ -311,15 +541,17 @@ class Agent(AgentBase):
         Returns:
             A ToolResponse containing the result.
         """
-        if tool_name not in self.tools:
+        tool = self.tools.get(tool_name)
+        if tool is None:
             return ToolResponse(
                 summary=f"Tool {tool_name} not found",
                 content=None,
                 error=f"Tool {tool_name} not found",
             )
 
-        tool = self.tools[tool_name]
         kwargs["agent_identity"] = self.identity
+        if not getattr(tool, "__tool_read_only__", False):
+            self.touch_context()
 
         try:
             response = tool(**kwargs)
@@ -329,6 +561,37 @@ class Agent(AgentBase):
                 summary=f"Error executing tool: {str(e)}", content=None, error=str(e)
             )
 
+    def _submit_tool_calls(self, tool_calls: List[ToolCall]) -> List["Future[str]"]:
+        """Start executing the tool calls from one model response.
+
+        Consecutive read-only calls run concurrently on the tool pool. Any other
+        call may change agent or context state, so it waits for the calls before
+        it and then runs alone in this thread, in the order the model made them.
+
+        Args:
+            tool_calls: The tool calls to execute.
+
+        Returns:
+            A future with the result of each tool call, in call order.
+        """
+        futures: List["Future[str]"] = []
+        running: List["Future[str]"] = []
+        for tool_call in tool_calls:
+            tool = self.tools.get(tool_call.function.name)
+            if getattr(tool, "__tool_read_only__", False):
+                future = _TOOL_POOL.submit(self.execute_tool_call, tool_call)
+                running.append(future)
+            else:
+                wait(running)
+                running = []
+                future = Future()
+                try:
+                    future.set_result(self.execute_tool_call(tool_call))
+                except Exception as e:
+                    future.set_exception(e)
+            futures.append(future)
+        return futures
+
     def execute_tool_call(self, tool_call: ToolCall) -> str:
         """Execute a tool call from the LLM.
 
@@ -339,8 +602,11 @@ class Agent(AgentBase):
             The result of the tool execution as a string.
         """
         try:
-            args = json.loads(tool_call.function.arguments)
-            response = self.execute_tool(tool_call.function.name, **args)
+            function = tool_call.function
+            raw_args = function.arguments
+            # Parameterless tools are commonly called with "{}", skip the parser
+            args = orjson.loads(raw_args) if raw_args and raw_args != "{}" else {}
+            response = self.execute_tool(function.name, **args)
 
             # Always return a string summary for LLM consumption
             if response.error:
@@ -356,11 +622,45 @@ class Agent(AgentBase):
         Returns:
             A list of context instructions.
         """
-        instructions = [
-            context.get_context_instructions(self.identity)
-            for context in self.contexts.values()
+        if not self._context_snapshot:
+            return []
+
+        cache = self._instructions_cache
+        if cache is not None and cache[0] == self._contexts_version:
+            return cache[1]
+
+        result = [
+            instruction
+            for instruction in (
+                context.get_context_instructions(self.identity)
+                for context in self._context_snapshot
+            )
+            if instruction is not None
         ]
-        return [x for x in instructions if x is not None]
+        self._instructions_cache = (self._contexts_version, result)
+        return result
+
+    def get_context_instructions_text(self, separator: str = "\n") -> str:
+        """Get the context instructions joined into a single string.
+
+        The joined text is cached per separator until the contexts change.
+
+        Args:
+            separator: The string placed between the instructions of two contexts.
+
+        Returns:
+            The joined context instructions.
+        """
+        cache = self._instructions_text_cache
+        if cache is None or cache[0] != self._contexts_version:
+            cache = (self._contexts_version, {})
+            self._instructions_text_cache = cache
+
+        text = cache[1].get(separator)
+        if text is None:
+            text = separator.join(self.get_context_instructions())
+            cache[1][separator] = text
+        return text
 
     def context_to_string(self, context_data: Dict[str, Any]) -> str:
         """Convert context data to a string representation.
@@ -384,10 +684,16 @@ class Agent(AgentBase):
         Returns:
             A list of context strings.
         """
-        contexts = [
-            context.get_context(self.identity) for context in self.contexts.values()
+        if not self._context_snapshot:
+            return []
+
+        return [
+            self.context_to_string(context_data)
+            for context_data in (
+                context.get_context(self.identity) for context in self._context_snapshot
+            )
+            if context_data is not None
         ]
-        return [self.context_to_string(x) for x in contexts if x is not None]
 
     def get_all_contexts(self) -> List[Dict[str, Any]]:
         """Get all context data.
@@ -406,12 +712,17 @@ class Agent(AgentBase):
         if not self.tools:
             return None
 
+        cache = self._schema_cache
+        if cache is not None and cache[0] == self._tools_version:
+            return cache[1]
+
         # Get all tool schemas
         tool_schemas = []
         for tool in self.tools.values():
             if hasattr(tool, "__tool_schema__"):
                 tool_schemas.append(tool.__tool_schema__)
 
+        self._schema_cache = (self._tools_version, tool_schemas)
         return tool_schemas
 
     def get_token_usage(self) -> Dict[str, int]:
@@ -425,6 +736,29 @@ class Agent(AgentBase):
     def clear_message_log(self) -> None:
         """Clear the agent's message history."""
         self.message_log.clear()
+        self._message_log_version += 1
+
+    def _trim_message_log(self) -> None:
+        """Drop the oldest turns once the message log exceeds its maximum length.
+
+        Only whole turns are dropped, up to the next user message, so the log
+        never starts with tool results that are separated from the call that
+        produced them. The latest turn is kept even if it alone is too long.
+        """
+        message_log = self.message_log
+        while len(message_log) > _MAX_HISTORY_MESSAGES:
+            next_turn = next(
+                (
+                    index
+                    for index, message in enumerate(message_log)
+                    if index and message.role == "user"
+                ),
+                None,
+            )
+            if next_turn is None:
+                break
+            for _ in range(next_turn):
+                message_log.popleft()
 
     def load_agent_tools(self) -> None:
         """Load all tools from the agent's tools directory."""
@@ -434,29 +768,20 @@ class Agent(AgentBase):
         if not tools_dir.exists():
             return
 
+        tools: List[Tool] = []
         for file in tools_dir.glob("*.py"):
             if file.stem == "__init__":
                 continue
 
             try:
                 # Import the module with agent-specific namespace
-                module_name = f"{self.identity.id}.{file.stem}"
-                spec = importlib.util.spec_from_file_location(module_name, file)
-                if spec is None or spec.loader is None:
-                    continue
-
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-
-                # Register any tools found
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if hasattr(attr, "__tool_schema__"):
-                        self.register_tool(attr)
-
+                module = load_tool_module(f"{self.identity.id}.{file.stem}", file)
             except Exception:
                 continue
+            tools.extend(getattr(module, name) for name in module_tool_names(module))
+
+        # Register every tool found in one go, so the tools version bumps once
+        self.register_tools(tools)
 
     def get_all_tool_names(self) -> List[str]:
         """Get all tool names from all contexts.
@@ -465,7 +790,7 @@ class Agent(AgentBase):
             List of tool names.
         """
         tool_names = []
-        for context in self.contexts.values():
+        for context in self._context_snapshot:
             context_data = context.get_context(self.identity)
             if "tools" in context_data:
                 tool_names.extend(context_data["tools"])
@@ -478,7 +803,7 @@ class Agent(AgentBase):
             List of all tools.
         """
         tools = []
-        for context in self.contexts.values():
+        for context in self._context_snapshot:
             tools.extend(context.tools)
         return tools
 
@@ -489,5 +814,5 @@ class Agent(AgentBase):
             List of context data dictionaries.
         """
         return [
-            context.get_context(self.identity) for context in self.contexts.values()
+            context.get_context(self.identity) for context in self._context_snapshot
         ]
@@ -2,6 +2,7 @@
 
 import os
 import secrets
+import textwrap
 from pathlib import Path
 from typing import Any, Dict
 from uuid import uuid4
@@ -20,16 +21,37 @@ TOKEN_ADDRESSES = {
     # Add more tokens as needed
 }
 
+_CRYPTO_INSTRUCTIONS = textwrap.dedent(
+    """
+    You have access to crypto trading capabilities through:
+    1. Token swaps on Uniswap
+    2. Balance checking
+    3. Price checking
+
+    Your Ethereum address is: {address}
+
+    In your first message to any user, you should:
+    1. Mention that you have a dedicated Ethereum wallet
+    2. Share your address: {address}
+    3. Politely ask them to send some ETH to enable trading capabilities
+    4. Explain that you'll need ETH for gas fees and tokens for trading
+
+    Use simple token symbols like 'eth', 'usdc', 'dai'.
+    All operations are performed on mainnet.
+
+    When discussing transactions or balances, always reference your Ethereum address.
+    Before attempting any trades, check your balance to ensure you have sufficient funds.
+    """
+).strip()
+
 
 class CryptoContext(Context):
     """Context for crypto operations including key management and DeFi interactions."""
 
-    tools: list[Tool] = []
-
     def __init__(self) -> None:
         """Initialize the crypto context with Web3 connection and key management."""
-        self.tools.extend([self.get_balance, self.request_faucet])
-        self.id = str(uuid4())
+        self.tools: list[Tool] = [self.get_balance, self.request_faucet]
+        self.id = uuid4().hex
         self.w3 = Web3(Web3.HTTPProvider(os.getenv("ETH_RPC_URL")))
 
         self.keys_dir = Path(os.getenv("KEYS_DIRECTORY", "secure/keys"))
@@ -103,26 +125,7 @@ class CryptoContext(Context):
         # Get public address
         account = Account.from_key(self.private_keys[agent.id])
 
-        return f"""
-        You have access to crypto trading capabilities through:
-        1. Token swaps on Uniswap
-        2. Balance checking
-        3. Price checking
-
-        Your Ethereum address is: {account.address}
-
-        In your first message to any user, you should:
-        1. Mention that you have a dedicated Ethereum wallet
-        2. Share your address: {account.address}
-        3. Politely ask them to send some ETH to enable trading capabilities
-        4. Explain that you'll need ETH for gas fees and tokens for trading
-
-        Use simple token symbols like 'eth', 'usdc', 'dai'.
-        All operations are performed on mainnet.
-
-        When discussing transactions or balances, always reference your Ethereum address.
-        Before attempting any trades, check your balance to ensure you have sufficient funds.
-        """
+        return _CRYPTO_INSTRUCTIONS.format(address=account.address)
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Get the current state of the crypto context.
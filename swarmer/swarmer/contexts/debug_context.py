@@ -1,14 +1,24 @@
 """Module for debugging agent tool usage and behavior."""
 
 import logging
+import textwrap
 from typing import Any, Dict, List, cast
 from uuid import uuid4
 
 from swarmer.swarmer_types import AgentIdentity, Context, Tool
-from swarmer.tools.utils import tool
+from swarmer.tools.utils import read_only, tool
 
 logger = logging.getLogger(__name__)
 
+_DEBUG_INSTRUCTIONS = textwrap.dedent(
+    """
+    Debug Context Instructions:
+    - Use 'trace_tool' to start debugging a tool
+    - Use 'untrace_tool' to stop debugging a tool
+    - Use 'list_traced_tools' to see which tools are being traced
+    """
+).strip()
+
 
 class DebugContext(Context):
     """Context for debugging tool execution.
@@ -20,13 +30,15 @@ class DebugContext(Context):
     - Manage which tools are being traced
     """
 
-    tools: List[Tool] = []
-
     def __init__(self) -> None:
         """Initialize the debug context with debugging tools and state tracking."""
         self.traced_tools: Dict[str, bool] = {}  # tool_name -> is_traced
-        self.tools.extend([self.trace_tool, self.untrace_tool, self.list_traced_tools])
-        self.id = str(uuid4())
+        self.tools: List[Tool] = [
+            self.trace_tool,
+            self.untrace_tool,
+            self.list_traced_tools,
+        ]
+        self.id = uuid4().hex
 
     def get_context_instructions(self, agent_identity: AgentIdentity) -> str:
         """Get instructions for using the debug context.
@@ -37,12 +49,7 @@ class DebugContext(Context):
         Returns:
             Instructions for using debugging tools.
         """
-        return """
-        Debug Context Instructions:
-        - Use 'trace_tool' to start debugging a tool
-        - Use 'untrace_tool' to stop debugging a tool
-        - Use 'list_traced_tools' to see which tools are being traced
-        """
+        return _DEBUG_INSTRUCTIONS
 
     def get_context(self, agent_identity: AgentIdentity) -> Dict[str, Any]:
         """Get the current state of the debug context.
@@ -129,6 +136,7 @@ class DebugContext(Context):
         self.traced_tools[tool_name] = False
         return f"Stopped tracing {tool_name}"
 
+    @read_only
     @tool
     def list_traced_tools(self, agent_identity: AgentIdentity) -> str:
         """List all tools currently being traced.
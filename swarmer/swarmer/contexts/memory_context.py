@@ -1,12 +1,82 @@
 """Module for managing agent memory and knowledge persistence."""
 
+import textwrap
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 from swarmer.swarmer_types import AgentIdentity, Context, Tool
-from swarmer.tools.utils import ToolResponse, tool
+from swarmer.tools.utils import ToolResponse, read_only, tool
+
+_MEMORY_INSTRUCTIONS = textwrap.dedent(
+    """
+    # Memory
+    You have access to a persistent memory system. Use it to maintain important
+    information across conversations. Use memory proactively - anything you think
+    is relevant to remember, you should add to memory. Follow these guidelines:
+
+    1. Memory Management:
+       - Store concise, important facts about users and conversations
+       - Add new insights as you learn them
+       - Update outdated information
+       - Remove irrelevant memories
+
+    2. When to Add Memories:
+       - User preferences and characteristics
+       - Important goals or tasks
+       - Key facts learned during conversation
+       - Significant context that might be useful later
+
+    3. Memory Quality:
+       - Keep memories concise and specific
+       - Rate importance appropriately (1-10)
+       - More important memories (8-10) should be key facts that significantly impact interactions
+       - Less important memories (1-4) can be minor preferences or temporary context
+
+    Only mention memory capabilities if relevant to the conversation.
+    """
+).strip()
+
+# Line formats for memory listings
+_CONTEXT_LINE = "- %s (ID: %s, Importance: %d)"
+_SUMMARY_LINE = "- %s (Importance: %d)"
+
+_ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _encode_memory_id(number: int) -> str:
+    """Encode a memory counter value as a short base62 string.
+
+    Args:
+        number: The non-negative counter value to encode.
+
+    Returns:
+        The base62 representation of the number.
+    """
+    digits = []
+    while True:
+        number, remainder = divmod(number, 62)
+        digits.append(_ID_ALPHABET[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+def _timestamp_ns(timestamp: Union[int, float]) -> int:
+    """Convert a saved memory timestamp to integer nanoseconds.
+
+    States saved before timestamps were stored in nanoseconds hold float seconds.
+
+    Args:
+        timestamp: The saved timestamp.
+
+    Returns:
+        The timestamp in nanoseconds since the epoch.
+    """
+    if isinstance(timestamp, float):
+        return int(timestamp * 1_000_000_000)
+    return timestamp
 
 
 @dataclass
@@ -15,12 +85,15 @@ class MemoryEntry:
 
     Attributes:
         content (str): The actual memory content
-        timestamp (float): When the memory was created/updated
+        timestamp (int): When the memory was created/updated, in nanoseconds
+            since the epoch
         importance (int): Importance score (1-10)
     """
 
+    __slots__ = ("content", "timestamp", "importance")
+
     content: str
-    timestamp: float
+    timestamp: int
     importance: int
 
     def to_dict(self) -> dict:
@@ -31,6 +104,25 @@ class MemoryEntry:
             "importance": self.importance,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryEntry":
+        """Create a memory entry from its serialized dictionary.
+
+        The slots are assigned directly, bypassing the keyword handling of the
+        generated __init__, since states can hold many memories.
+
+        Args:
+            data: The serialized memory entry.
+
+        Returns:
+            The memory entry.
+        """
+        memory = cls.__new__(cls)
+        memory.content = data["content"]
+        memory.timestamp = _timestamp_ns(data["timestamp"])
+        memory.importance = data["importance"]
+        return memory
+
 
 class MemoryContext(Context):
     """Context for managing agent memory and knowledge persistence.
@@ -39,15 +131,24 @@ class MemoryContext(Context):
     enabling long-term memory capabilities for agents.
     """
 
-    tools: List[Tool] = []
-
     def __init__(self) -> None:
         """Initialize memory context with storage and retrieval tools."""
         self.agent_memories: Dict[str, Dict[str, MemoryEntry]] = {}
-        self.tools.extend(
-            [self.add_memory, self.get_memories, self.update_memory, self.remove_memory]
-        )
-        self.id = str(uuid4())
+        # Context returned by get_context per agent; dropped on every change
+        self._context_cache: Dict[str, Dict[str, Any]] = {}
+        # Next memory id number per agent, memory ids are only unique per agent
+        self._next_memory_id: Dict[str, int] = {}
+        # Held while allocating a memory id and storing the memory under it
+        self._id_lock = threading.Lock()
+        # Incremented whenever agent_memories changes
+        self.revision = 0
+        self.tools: List[Tool] = [
+            self.add_memory,
+            self.get_memories,
+            self.update_memory,
+            self.remove_memory,
+        ]
+        self.id = uuid4().hex
 
     def get_context_instructions(self, agent: AgentIdentity) -> str:
         """Get instructions for using the memory context.
@@ -58,35 +159,14 @@ class MemoryContext(Context):
         Returns:
             Instructions for using memory operations.
         """
-        return """
-        # Memory
-        You have access to a persistent memory system. Use it to maintain important
-        information across conversations. Use memory proactively - anything you think
-        is relevant to remember, you should add to memory. Follow these guidelines:
-
-        1. Memory Management:
-           - Store concise, important facts about users and conversations
-           - Add new insights as you learn them
-           - Update outdated information
-           - Remove irrelevant memories
-
-        2. When to Add Memories:
-           - User preferences and characteristics
-           - Important goals or tasks
-           - Key facts learned during conversation
-           - Significant context that might be useful later
-
-        3. Memory Quality:
-           - Keep memories concise and specific
-           - Rate importance appropriately (1-10)
-           - More important memories (8-10) should be key facts that significantly impact interactions
-           - Less important memories (1-4) can be minor preferences or temporary context
-
-        Only mention memory capabilities if relevant to the conversation.
-        """
+        return _MEMORY_INSTRUCTIONS
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Return relevant memories for the current context."""
+        context = self._context_cache.get(agent.id)
+        if context is not None:
+            return context
+
         memories = self.agent_memories.get(agent.id, {})
         if not memories:
             return {}
@@ -97,20 +177,33 @@ class MemoryContext(Context):
         )
 
         context_parts = ["Current memories:"]
-        for memory_id, memory in sorted_memories:
-            context_parts.append(
-                f"- {memory.content} (ID: {memory_id}, Importance: {memory.importance})"
-            )
+        context_parts.extend(
+            _CONTEXT_LINE % (memory.content, memory_id, memory.importance)
+            for memory_id, memory in sorted_memories
+        )
 
-        return {"memories": context_parts}
+        context = {"memories": context_parts}
+        self._context_cache[agent.id] = context
+        return context
 
     def _get_agent_memories(
         self, agent_identity: AgentIdentity
     ) -> Dict[str, MemoryEntry]:
         """Get or initialize agent's memory store."""
-        if agent_identity.id not in self.agent_memories:
-            self.agent_memories[agent_identity.id] = {}
-        return self.agent_memories[agent_identity.id]
+        return self.agent_memories.setdefault(agent_identity.id, {})
+
+    def _new_memory_id(self, agent_id: str, memories: Dict[str, MemoryEntry]) -> str:
+        """Generate a short memory id that is unused for the given agent.
+
+        Must be called with _id_lock held, until the memory is stored under it.
+        """
+        number = self._next_memory_id.get(agent_id, 0)
+        memory_id = _encode_memory_id(number)
+        while memory_id in memories:
+            number += 1
+            memory_id = _encode_memory_id(number)
+        self._next_memory_id[agent_id] = number + 1
+        return memory_id
 
     @tool
     def add_memory(
@@ -132,12 +225,15 @@ class MemoryContext(Context):
 
         try:
             memory = MemoryEntry(
-                content=content, timestamp=time.time(), importance=importance
+                content=content, timestamp=time.time_ns(), importance=importance
             )
 
-            memory_id = str(uuid4())
             memories = self._get_agent_memories(agent_identity)
-            memories[memory_id] = memory
+            with self._id_lock:
+                memory_id = self._new_memory_id(agent_identity.id, memories)
+                memories[memory_id] = memory
+            self._context_cache.pop(agent_identity.id, None)
+            self.revision += 1
 
             success_msg = f"Added new memory: {content} (Importance: {importance})"
             return ToolResponse(
@@ -152,6 +248,7 @@ class MemoryContext(Context):
             error_msg = f"Failed to add memory: {str(e)}"
             return ToolResponse(summary=error_msg, content=None, error=error_msg)
 
+    @read_only
     @tool
     def get_memories(
         self,
@@ -178,7 +275,7 @@ class MemoryContext(Context):
             for mid, memory in memories.items():
                 memory_list.append({"id": mid, **memory.to_dict()})
                 summary_items.append(
-                    f"- {memory.content} (Importance: {memory.importance})"
+                    _SUMMARY_LINE % (memory.content, memory.importance)
                 )
 
             summary = f"Found {len(memories)} memories:\n" + "\n".join(summary_items)
@@ -216,21 +313,20 @@ class MemoryContext(Context):
                 error_msg = f"Failed to update: Memory {memory_id} not found"
                 return ToolResponse(summary=error_msg, content=None, error=error_msg)
 
+            if importance is not None and not 1 <= importance <= 10:
+                error_msg = "Failed to update: Importance must be between 1 and 10"
+                return ToolResponse(summary=error_msg, content=None, error=error_msg)
+
             memory = memories[memory_id]
             changes = {"old": memory.to_dict(), "new": {}}
 
             # Update content
             memory.content = content
-            memory.timestamp = time.time()
+            memory.timestamp = time.time_ns()
             changes["new"]["content"] = content
 
             # Update importance if provided
             if importance is not None:
-                if not 1 <= importance <= 10:
-                    error_msg = "Failed to update: Importance must be between 1 and 10"
-                    return ToolResponse(
-                        summary=error_msg, content=None, error=error_msg
-                    )
                 memory.importance = importance
                 changes["new"]["importance"] = importance
             else:
@@ -238,6 +334,11 @@ class MemoryContext(Context):
 
             changes["new"]["timestamp"] = memory.timestamp
 
+            # Invalidate only once the memory changed, so a get_context call
+            # racing the update cannot cache the old state again
+            self._context_cache.pop(agent_identity.id, None)
+            self.revision += 1
+
             summary = f"Updated memory: {content}"
             if importance is not None:
                 summary += f" (Importance: {importance})"
@@ -276,6 +377,8 @@ class MemoryContext(Context):
 
             memory = memories[memory_id]
             del memories[memory_id]
+            self._context_cache.pop(agent_identity.id, None)
+            self.revision += 1
 
             return ToolResponse(
                 summary=f"Removed memory: {memory.content}",
@@ -299,15 +402,12 @@ class MemoryContext(Context):
             "id": self.id,
             "agent_memories": {
                 agent_id: {
-                    memory_id: {
-                        "content": memory.content,
-                        "importance": memory.importance,
-                        "timestamp": memory.timestamp,
-                    }
+                    memory_id: memory.to_dict()
                     for memory_id, memory in memories.items()
                 }
                 for agent_id, memories in self.agent_memories.items()
             },
+            "next_memory_id": dict(self._next_memory_id),
         }
 
     def deserialize(self, state: Dict, agent_identity: AgentIdentity) -> None:
@@ -322,8 +422,14 @@ class MemoryContext(Context):
         # Restore memories
         self.agent_memories = {
             agent_id: {
-                memory_id: MemoryEntry(**memory_data)
+                memory_id: MemoryEntry.from_dict(memory_data)
                 for memory_id, memory_data in memories.items()
             }
             for agent_id, memories in state["agent_memories"].items()
         }
+        # States saved before short ids have UUID keys and no counters
+        self._next_memory_id = dict(state.get("next_memory_id", {}))
+
+        # Invalidate only once the new state is in place, see update_memory
+        self._context_cache.clear()
+        self.revision += 1
@@ -1,13 +1,35 @@
 """Module for managing agent personas and personality traits."""
 
+import textwrap
 import uuid
+from functools import partial
 from typing import Any, Dict, List, Optional, cast
 
 from swarmer.globals.agent_registry import agent_registry
 from swarmer.instructions.instruction import Persona
-from swarmer.swarmer_types import AgentIdentity, Context, Tool
+from swarmer.swarmer_types import AgentBase, AgentIdentity, Context, Tool
 from swarmer.tools.utils import ToolResponse, function_to_schema, tool
 
+_PERSONA_INSTRUCTIONS = textwrap.dedent(
+    """
+    Persona Context Instructions:
+    - Maintain consistent personality traits
+    - Follow defined behavioral patterns
+    - Use persona-specific language and tone
+    """
+).strip()
+
+# Persona switch tools share one signature, so their schemas only differ in the
+# name and description; the rest is generated once and shared
+_SWITCH_SCHEMA_TEMPLATE: Optional[dict] = None
+
+
+def _switch_persona(
+    context: "PersonaContext", persona_id: str, agent_identity: AgentIdentity
+) -> ToolResponse:
+    """Switch personas, bound to a context and persona for each switch tool."""
+    return context.persona_switch_tool(agent_identity, persona_id)
+
 
 class PersonaContext(Context):
     """Context for managing agent personality and behavior characteristics.
@@ -19,14 +41,14 @@ class PersonaContext(Context):
     maintaining proper encapsulation of behavioral state.
     """
 
-    tools: List[Tool] = []
-
     def __init__(self) -> None:
         """Initialize persona context with personality management tools."""
-        self.tools.append(self.create_persona)
+        self.tools: List[Tool] = [self.create_persona]
         self.agent_persona: Dict[str, Persona] = {}
         self.persona_collection: Dict[str, Persona] = {}
-        self.id = str(uuid.uuid4())
+        self.id = uuid.uuid4().hex
+        # Incremented whenever a persona is added, changed or switched to
+        self.revision = 0
 
     def get_context_instructions(self, agent: AgentIdentity) -> str:
         """Get instructions for using the persona context.
@@ -37,12 +59,7 @@ class PersonaContext(Context):
         Returns:
             Instructions for using persona management tools.
         """
-        return """
-        Persona Context Instructions:
-        - Maintain consistent personality traits
-        - Follow defined behavioral patterns
-        - Use persona-specific language and tone
-        """
+        return _PERSONA_INSTRUCTIONS
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Get the current persona state.
@@ -68,10 +85,11 @@ class PersonaContext(Context):
             agent_identity: The identity of the agent setting the active persona.
             persona_id: The ID of the persona to set as active.
         """
-        if persona_id in self.persona_collection:
-            self.agent_persona[agent_identity.id] = self.persona_collection[persona_id]
-        else:
+        persona = self.persona_collection.get(persona_id)
+        if persona is None:
             raise ValueError(f"No persona found with id: {persona_id}")
+        self.agent_persona[agent_identity.id] = persona
+        self.revision += 1
 
     def get_active_persona(self, agent_identity: AgentIdentity) -> Optional[Persona]:
         """Get the active persona for the given agent.
@@ -111,6 +129,52 @@ class PersonaContext(Context):
             error_msg = f"Failed to switch persona: {str(e)}"
             return ToolResponse(summary=error_msg, content=None, error=error_msg)
 
+    @staticmethod
+    def _switch_tool_schema(wrapper: Tool) -> dict:
+        """Build the schema for a persona switch tool from the shared template.
+
+        Args:
+            wrapper: The switch tool, with its name and docstring already set.
+
+        Returns:
+            The tool schema for the switch tool.
+        """
+        global _SWITCH_SCHEMA_TEMPLATE
+
+        if _SWITCH_SCHEMA_TEMPLATE is None:
+            _SWITCH_SCHEMA_TEMPLATE = function_to_schema(wrapper, wrapper.__name__)
+        return {
+            **_SWITCH_SCHEMA_TEMPLATE,
+            "function": {
+                **_SWITCH_SCHEMA_TEMPLATE["function"],
+                "name": wrapper.__name__,
+                "description": (wrapper.__doc__ or "").strip(),
+            },
+        }
+
+    @staticmethod
+    def _switch_tool_name(persona: Persona) -> str:
+        """Get the name of the tool that switches to a persona."""
+        return f"become_{persona.name}_{persona.short_id}"
+
+    def _register_switch_tool(self, agent: AgentBase, persona: Persona) -> Tool:
+        """Create the tool that switches to a persona and register it with the agent.
+
+        Args:
+            agent: The agent to register the switch tool with.
+            persona: The persona the tool switches to.
+
+        Returns:
+            The registered switch tool.
+        """
+        wrapper = cast(Tool, partial(_switch_persona, self, persona.id))
+        wrapper.__name__ = self._switch_tool_name(persona)
+        wrapper.__doc__ = f"Switch to the {persona.name} persona. Only one persona switch can be called at a time and it must be the last call in the sequence."
+        wrapper.__tool_schema__ = self._switch_tool_schema(wrapper)
+
+        agent.register_tool(wrapper)
+        return wrapper
+
     @tool
     def create_persona(
         self, agent_identity: AgentIdentity, persona: str, description: str, name: str
@@ -134,18 +198,33 @@ class PersonaContext(Context):
             agent = agent_registry.get_agent(agent_identity)
             persona_obj = Persona(persona, description, name)
 
+            # Personas with the same name and prompt get the same id, reuse the
+            # registered switch tool and keep the latest description
+            switch_name = self._switch_tool_name(persona_obj)
+            existing = self.persona_collection.get(persona_obj.id)
+            if existing is not None and switch_name in agent.tools:
+                if existing.description != description:
+                    existing.description = description
+                    self.revision += 1
+                return ToolResponse(
+                    summary=f"Persona already exists with switch function name: {switch_name}",
+                    content={
+                        "status": "success",
+                        "already_existed": True,
+                        "persona": {
+                            "id": existing.id,
+                            "name": existing.name,
+                            "description": existing.description,
+                            "switch_function": switch_name,
+                        },
+                    },
+                    error=None,
+                )
+
             # Register persona
             self.persona_collection[persona_obj.id] = persona_obj
-
-            def _wrapper(agent_identity: AgentIdentity) -> ToolResponse:
-                return self.persona_switch_tool(agent_identity, persona_obj.id)
-
-            wrapper = cast(Tool, _wrapper)
-            wrapper.__name__ = f"become_{persona_obj.name}_{persona_obj.id[:16]}"
-            wrapper.__doc__ = f"Switch to the {persona_obj.name} persona. Only one persona switch can be called at a time and it must be the last call in the sequence."
-            wrapper.__tool_schema__ = function_to_schema(wrapper, wrapper.__name__)
-
-            agent.register_tool(wrapper)
+            self.revision += 1
+            wrapper = self._register_switch_tool(agent, persona_obj)
 
             success_msg = (
                 f"Created persona with switch function name: {wrapper.__name__}"
@@ -202,21 +281,23 @@ class PersonaContext(Context):
         """
         self.id = state["id"]
 
-        # Restore personas
-        self.persona_collection = {
-            persona_id: Persona(**persona_data)
-            for persona_id, persona_data in state["persona_collection"].items()
-        }
-        self.agent_persona = {
-            agent_id: Persona(**persona_data)
-            for agent_id, persona_data in state["agent_persona"].items()
-        }
+        # Restore personas, keyed by their recomputed ids in case the state was
+        # saved with ids from an older hash
+        personas = [Persona(**data) for data in state["persona_collection"].values()]
+        self.persona_collection = {persona.id: persona for persona in personas}
+        self.agent_persona = {}
+        for agent_id, persona_data in state["agent_persona"].items():
+            persona = Persona(**persona_data)
+            # Persona ids are derived from their content, so the active persona
+            # can share the object restored into the collection
+            self.agent_persona[agent_id] = self.persona_collection.get(
+                persona.id, persona
+            )
+        # Bumped once the personas are restored, so a view rendered meanwhile
+        # is not cached under the new revision
+        self.revision += 1
 
-        # Recreate switch tools for each persona
+        # Recreate switch tools for the restored personas
+        agent = agent_registry.get_agent(agent_identity)
         for persona in self.persona_collection.values():
-            self.create_persona(
-                agent_identity=agent_identity,
-                persona=persona.instruction,
-                description=persona.description,
-                name=persona.name,
-            )
+            self._register_switch_tool(agent, persona)
@@ -1,12 +1,31 @@
 """Module implementing web search functionality for agents."""
 
-from typing import Any, Dict, List
+import textwrap
+from typing import Any, Dict, List, cast
 from uuid import uuid4
 
 from swarmer.swarmer_types import AgentIdentity, Context, Tool
 from swarmer.tools.google_search import search_google
 from swarmer.tools.web_reader import read_webpage
 
+_SEARCH_INSTRUCTIONS = textwrap.dedent(
+    """
+    You have access to web search and content reading tools that allow you to:
+    1. Search Google for information
+    2. Read and extract content from web pages
+
+    Use these capabilities when you need to:
+    - Find information on the web
+    - Read and analyze webpage content
+    - Research topics or answer questions
+
+    The tools will handle:
+    - Search result formatting
+    - Content extraction and cleaning
+    - Error handling and rate limiting
+    """
+).strip()
+
 
 class SearchContext(Context):
     """Context for performing web searches and retrieving information.
@@ -18,10 +37,10 @@ class SearchContext(Context):
     def __init__(self) -> None:
         """Initialize search context with web search tools."""
         super().__init__()
-        self.tools: List[Tool] = []  # Initialize tools list
-        # Cast the functions to Tool type since they should implement the protocol
-        self.tools.extend([Tool(search_google), Tool(read_webpage)])  # type: ignore
-        self.id = str(uuid4())
+        # The tool decorator already made these Tools, the protocol can't be
+        # instantiated so only the static type needs adjusting
+        self.tools: List[Tool] = [cast(Tool, search_google), cast(Tool, read_webpage)]
+        self.id = uuid4().hex
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Get the current search context.
@@ -46,21 +65,7 @@ class SearchContext(Context):
         Returns:
             Instructions for using search tools.
         """
-        return """
-        You have access to web search and content reading tools that allow you to:
-        1. Search Google for information
-        2. Read and extract content from web pages
-
-        Use these capabilities when you need to:
-        - Find information on the web
-        - Read and analyze webpage content
-        - Research topics or answer questions
-
-        The tools will handle:
-        - Search result formatting
-        - Content extraction and cleaning
-        - Error handling and rate limiting
-        """
+        return _SEARCH_INSTRUCTIONS
 
     def serialize(self) -> dict:
         """Serialize context state - SearchContext is stateless."""
@@ -1,11 +1,21 @@
 """Module for managing time-related operations and scheduling."""
 
+import textwrap
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from swarmer.swarmer_types import AgentIdentity, Context, Tool
-from swarmer.tools.utils import ToolResponse, tool
+from swarmer.tools.utils import ToolResponse, read_only, tool
+
+_TIME_INSTRUCTIONS = textwrap.dedent(
+    """
+    Time Context Instructions:
+    - Use time-related tools to track and manage time
+    - Available tools: get_current_time, format_timestamp, get_time_difference
+    """
+).strip()
 
 
 class TimeContext(Context):
@@ -15,14 +25,17 @@ class TimeContext(Context):
     including getting current time, scheduling tasks, and managing timeouts.
     """
 
-    tools: list[Tool] = []
-
     def __init__(self) -> None:
         """Initialize time context with time management tools."""
-        self.tools.extend(
-            [self.get_current_time, self.format_timestamp, self.get_time_difference]
-        )
-        self.id = str(uuid4())
+        self.tools: list[Tool] = [
+            self.get_current_time,
+            self.format_timestamp,
+            self.get_time_difference,
+        ]
+        self.id = uuid4().hex
+        # The context only changes once per second, so it is reused within one
+        self._context_second = -1
+        self._context: Optional[Dict[str, Any]] = None
 
     def get_context_instructions(self, agent: AgentIdentity) -> str:
         """Get instructions for using the time context.
@@ -33,11 +46,7 @@ class TimeContext(Context):
         Returns:
             Instructions for using time-related tools.
         """
-        return """
-        Time Context Instructions:
-        - Use time-related tools to track and manage time
-        - Available tools: get_current_time, format_timestamp, get_time_difference
-        """
+        return _TIME_INSTRUCTIONS
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Get the current time context.
@@ -48,13 +57,18 @@ class TimeContext(Context):
         Returns:
             Current time state and available tools.
         """
-        current_time = datetime.now(timezone.utc)
-        return {
-            "current_time": current_time.isoformat(),
-            "timezone": "UTC",
-            "tools": [tool.__name__ for tool in self.tools],
-        }
-
+        second = int(time.time())
+        if self._context is None or second != self._context_second:
+            current_time = datetime.fromtimestamp(second, timezone.utc)
+            self._context = {
+                "current_time": current_time.isoformat(),
+                "timezone": "UTC",
+                "tools": [tool.__name__ for tool in self.tools],
+            }
+            self._context_second = second
+        return self._context
+
+    @read_only
     @tool
     def get_current_time(
         self, agent_identity: AgentIdentity, format: str = "iso"
@@ -96,6 +110,7 @@ class TimeContext(Context):
             error_msg = f"Error getting current time: {str(e)}"
             return ToolResponse(summary=error_msg, content=None, error=error_msg)
 
+    @read_only
     @tool
     def format_timestamp(
         self, agent_identity: AgentIdentity, timestamp: float, format: str = "human"
@@ -138,6 +153,7 @@ class TimeContext(Context):
             error_msg = f"Error formatting timestamp: {str(e)}"
             return ToolResponse(summary=error_msg, content=None, error=error_msg)
 
+    @read_only
     @tool
     def get_time_difference(
         self, agent_identity: AgentIdentity, timestamp1: float, timestamp2: float
@@ -154,24 +170,20 @@ class TimeContext(Context):
         """
         try:
             diff_seconds = abs(timestamp2 - timestamp1)
-            days = int(diff_seconds // (24 * 3600))
-            remaining = diff_seconds % (24 * 3600)
-            hours = int(remaining // 3600)
-            remaining %= 3600
-            minutes = int(remaining // 60)
-            seconds = int(remaining % 60)
-
-            human_diff = []
-            if days > 0:
-                human_diff.append(f"{days} days")
-            if hours > 0:
-                human_diff.append(f"{hours} hours")
-            if minutes > 0:
-                human_diff.append(f"{minutes} minutes")
-            if seconds > 0 or not human_diff:
-                human_diff.append(f"{seconds} seconds")
-
-            human_readable = ", ".join(human_diff)
+            days, remaining = divmod(int(diff_seconds), 24 * 3600)
+            hours, remaining = divmod(remaining, 3600)
+            minutes, seconds = divmod(remaining, 60)
+
+            units = (
+                ("days", days),
+                ("hours", hours),
+                ("minutes", minutes),
+                ("seconds", seconds),
+            )
+            human_readable = (
+                ", ".join(f"{value} {unit}" for unit, value in units if value)
+                or "0 seconds"
+            )
 
             return ToolResponse(
                 summary=f"Time difference: {human_readable}",
@@ -1,17 +1,115 @@
 """Module for dynamic tool creation and management."""
 
 import ast
+import functools
 import importlib.util
 import logging
 import os
+import py_compile
 import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from types import ModuleType
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from swarmer.globals.agent_registry import agent_registry
 from swarmer.swarmer_types import AgentIdentity, Context, Tool
-from swarmer.tools.utils import ToolResponse, tool
+from swarmer.tools.loader import load_tool_module, module_tool_names
+from swarmer.tools.utils import ToolResponse, read_only, tool
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_CALLS = frozenset(("eval", "exec", "compile"))
+
+_TOOL_CREATION_INSTRUCTIONS = textwrap.dedent(
+    """
+    Tool Creation Context Instructions:
+    - Use create_tool to define new tools
+    - Use remove_tool to delete existing tools
+    - Use list_tools to see available tools
+    """
+).strip()
+
+# Imports written at the top of every tool file
+_TOOL_IMPORTS = (
+    "from swarmer.tools.utils import tool, ToolResponse\n"
+    "from swarmer.tools.dependencies import requires\n"
+    "from swarmer.swarmer_types import AgentIdentity\n\n"
+)
+
+# Upper bound on the threads used to reload an agent's tools on deserialize
+_MAX_RELOAD_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=128)
+def _is_valid_tool_code(code: str) -> bool:
+    """Check that tool code defines a tool and makes no unsafe calls.
+
+    Results are cached by source, since models often resubmit the same code
+    when retrying a create or update.
+
+    Args:
+        code: The tool code to validate.
+
+    Returns:
+        True if the code is valid, False otherwise.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+
+    # Look for the tool decorator and unsafe calls in a single pass, walking the
+    # tree depth first with a plain list instead of ast.walk's deque
+    has_tool_decorator = False
+    stack: List[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        stack.extend(ast.iter_child_nodes(node))
+        if isinstance(node, ast.Call):
+            if isinstance(node.func, ast.Name) and node.func.id in _UNSAFE_CALLS:
+                return False
+        elif isinstance(node, ast.FunctionDef) and not has_tool_decorator:
+            has_tool_decorator = any(
+                isinstance(decorator, ast.Name) and decorator.id == "tool"
+                for decorator in node.decorator_list
+            )
+
+    return has_tool_decorator
+
+
+def _write_tool_file(file_path: Path, code: str) -> None:
+    """Write tool code to a file, preceded by the imports tools rely on.
+
+    The header and code are written separately rather than concatenated first,
+    which would copy the whole tool code into a new string.
+
+    Args:
+        file_path: The path of the tool file.
+        code: The tool code.
+    """
+    with open(file_path, "w") as f:
+        f.write(_TOOL_IMPORTS)
+        f.write(code)
+
+
+def _compile_tool_file(file_path: Path) -> None:
+    """Write the cached bytecode for a tool file next to it in __pycache__.
+
+    The import system then loads the tool from bytecode, also after a restart.
+    The bytecode is validated against a hash of the source rather than its
+    mtime, since update_tool can rewrite a file within the same second.
+
+    Args:
+        file_path: The path of the tool file.
+    """
+    py_compile.compile(
+        str(file_path),
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
 
 
 class ToolCreationContext(Context):
@@ -21,16 +119,19 @@ class ToolCreationContext(Context):
     at runtime, allowing for dynamic expansion of capabilities.
     """
 
-    tools: List[Tool] = []
-
     def __init__(self) -> None:
         """Initialize tool creation context with tool management capabilities."""
-        self.tools.extend(
-            [self.create_tool, self.list_tools, self.remove_tool, self.update_tool]
-        )
-        self.id = str(uuid4())
+        self.tools: List[Tool] = [
+            self.create_tool,
+            self.list_tools,
+            self.remove_tool,
+            self.update_tool,
+        ]
+        self.id = uuid4().hex
         self.base_tools_dir = Path(os.getenv("AGENT_TOOLS_DIRECTORY", "agent_tools"))
         self.base_tools_dir.mkdir(parents=True, exist_ok=True)
+        # Agent tool directories that have already been created
+        self._agent_dirs: Dict[str, Path] = {}
 
     def get_context_instructions(self, agent: AgentIdentity) -> str:
         """Get instructions for using the tool creation context.
@@ -41,12 +142,7 @@ class ToolCreationContext(Context):
         Returns:
             Instructions for using tool creation capabilities.
         """
-        return """
-        Tool Creation Context Instructions:
-        - Use create_tool to define new tools
-        - Use remove_tool to delete existing tools
-        - Use list_tools to see available tools
-        """
+        return _TOOL_CREATION_INSTRUCTIONS
 
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
         """Get the current tool creation context.
@@ -75,8 +171,11 @@ class ToolCreationContext(Context):
         Returns:
             The directory path for the agent's tools.
         """
-        agent_dir = self.base_tools_dir / agent_id
-        agent_dir.mkdir(parents=True, exist_ok=True)
+        agent_dir = self._agent_dirs.get(agent_id)
+        if agent_dir is None:
+            agent_dir = self.base_tools_dir / agent_id
+            agent_dir.mkdir(parents=True, exist_ok=True)
+            self._agent_dirs[agent_id] = agent_dir
         return agent_dir
 
     def list_available_tools(self, agent_id: str) -> List[str]:
@@ -88,13 +187,17 @@ class ToolCreationContext(Context):
         Returns:
             A list of available tool names.
         """
-        tools = []
-        agent_dir = self.get_agent_tools_dir(agent_id)
-        for file in agent_dir.glob("*.py"):
-            module_name = file.stem
-            if module_name != "__init__":
-                tools.append(module_name)
-        return tools
+        # Called for every prompt through get_context, so the directory is only
+        # read, not created, and scandir avoids a stat per entry
+        try:
+            with os.scandir(self.base_tools_dir / agent_id) as entries:
+                return [
+                    entry.name[:-3]
+                    for entry in entries
+                    if entry.name.endswith(".py") and entry.name != "__init__.py"
+                ]
+        except FileNotFoundError:
+            return []
 
     def validate_tool_code(self, code: str) -> bool:
         """Validate tool code for safety and correctness.
@@ -105,32 +208,7 @@ class ToolCreationContext(Context):
         Returns:
             True if the code is valid, False otherwise.
         """
-        try:
-            tree = ast.parse(code)
-
-            # Check for tool decorator
-            has_tool_decorator = False
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    for decorator in node.decorator_list:
-                        if isinstance(decorator, ast.Name) and decorator.id == "tool":
-                            has_tool_decorator = True
-                            break
-
-            if not has_tool_decorator:
-                return False
-
-            # Check for unsafe operations
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name):
-                        if node.func.id in ["eval", "exec", "compile"]:
-                            return False
-
-            return True
-
-        except SyntaxError:
-            return False
+        return _is_valid_tool_code(code)
 
     @tool
     def create_tool(
@@ -146,7 +224,6 @@ class ToolCreationContext(Context):
         Returns:
             ToolResponse containing status message and detailed information
         """
-        logger = logging.getLogger(__name__)
         logger.info(f"Creating tool '{name}' for agent {agent_identity.id}")
 
         if not self.validate_tool_code(code):
@@ -162,17 +239,14 @@ class ToolCreationContext(Context):
         file_path = agent_dir / f"{name}.py"
         logger.info(f"Writing tool to {file_path}")
 
-        # Add necessary imports
-        final_code = (
-            "from swarmer.tools.utils import tool, ToolResponse\n"
-            "from swarmer.tools.dependencies import requires\n"
-            "from swarmer.swarmer_types import AgentIdentity\n\n"
-        ) + code
-
         try:
+            # Drop a tool created under this name before, so the new file is
+            # executed even if it kept the old mtime
+            self._unload_tool(name, agent_identity)
+
             # Save tool file
-            with open(file_path, "w") as f:
-                f.write(final_code)
+            _write_tool_file(file_path, code)
+            _compile_tool_file(file_path)
             logger.info(f"Successfully wrote tool file {file_path}")
 
             # Load the tool
@@ -215,27 +289,60 @@ class ToolCreationContext(Context):
             name: The name of the tool to load
             agent_identity: The identity of the agent loading the tool
         """
+        module = self._load_tool_module(name, agent_identity)
+
+        # Register the tool functions
+        agent = agent_registry.get_agent(agent_identity)
+        agent.register_tools(
+            getattr(module, attr_name) for attr_name in module_tool_names(module)
+        )
+
+    def _load_tool_module(self, name: str, agent_identity: AgentIdentity) -> ModuleType:
+        """Load a tool module without registering its tools.
+
+        Args:
+            name: The name of the tool to load
+            agent_identity: The identity of the agent loading the tool
+
+        Returns:
+            The loaded tool module.
+        """
         agent_dir = self.get_agent_tools_dir(agent_identity.id)
         file_path = agent_dir / f"{name}.py"
+        module_name = f"{agent_identity.id}.{name}"
+        return load_tool_module(module_name, file_path)
 
-        # Import the module
-        spec = importlib.util.spec_from_file_location(
-            f"{agent_identity.id}.{name}", file_path
-        )
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Could not load module spec for {name}")
+    def _unload_tool(self, name: str, agent_identity: AgentIdentity) -> None:
+        """Remove a tool module from sys.modules and unregister its tools.
 
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[f"{agent_identity.id}.{name}"] = module
-        spec.loader.exec_module(module)
+        Tools are registered under their function names, which need not match
+        the name of the file that defines them.
 
-        # Find and register tool functions
+        Args:
+            name: The name of the tool file (without .py)
+            agent_identity: The identity of the agent the tool belongs to
+        """
+        module = sys.modules.pop(f"{agent_identity.id}.{name}", None)
+        if module is None:
+            return
+
+        logger.info(f"Unloaded tool module '{name}' for agent {agent_identity.id}")
         agent = agent_registry.get_agent(agent_identity)
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if hasattr(attr, "__tool_schema__"):
-                agent.register_tool(attr)
+        for tool_name in module_tool_names(module):
+            if tool_name in agent.tools:
+                agent.unregister_tool(tool_name)
+
+    def _try_load_tool_module(
+        self, name: str, agent_identity: AgentIdentity
+    ) -> Optional[ModuleType]:
+        """Load a tool module, returning None if it fails to load."""
+        try:
+            return self._load_tool_module(name, agent_identity)
+        except Exception:
+            logger.warning("Failed to reload tool '%s'", name, exc_info=True)
+            return None
 
+    @read_only
     @tool
     def list_tools(self, agent_identity: AgentIdentity) -> ToolResponse:
         """List all available custom tools.
@@ -269,21 +376,25 @@ class ToolCreationContext(Context):
         agent_dir = self.get_agent_tools_dir(agent_identity.id)
         file_path = agent_dir / f"{name}.py"
 
-        if not file_path.exists():
-            error_msg = f"Tool '{name}' not found"
-            return ToolResponse(
-                summary=error_msg,
-                content={"status": "error", "message": error_msg},
-                error=error_msg,
-            )
-
         try:
-            file_path.unlink()
+            # Unlink straight away, a missing file is reported by the unlink
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                error_msg = f"Tool '{name}' not found"
+                return ToolResponse(
+                    summary=error_msg,
+                    content={"status": "error", "message": error_msg},
+                    error=error_msg,
+                )
+
+            # Remove the bytecode written when the tool was saved
+            try:
+                os.unlink(importlib.util.cache_from_source(str(file_path)))
+            except FileNotFoundError:
+                pass
 
-            # Remove from sys.modules if loaded
-            module_name = f"{agent_identity.id}.{name}"
-            if module_name in sys.modules:
-                del sys.modules[module_name]
+            self._unload_tool(name, agent_identity)
 
             success_msg = f"Tool '{name}' removed successfully"
             return ToolResponse(
@@ -313,7 +424,6 @@ class ToolCreationContext(Context):
         Returns:
             ToolResponse containing status of the update operation
         """
-        logger = logging.getLogger(__name__)
         logger.info(f"Updating tool '{name}' for agent {agent_identity.id}")
 
         # Check if tool exists
@@ -336,31 +446,13 @@ class ToolCreationContext(Context):
                 error=error_msg,
             )
 
-        # Add necessary imports
-        final_code = (
-            "from swarmer.tools.utils import tool, ToolResponse\n"
-            "from swarmer.tools.dependencies import requires\n"
-            "from swarmer.swarmer_types import AgentIdentity\n\n"
-        ) + code
-
         try:
-            # Get agent instance
-            agent = agent_registry.get_agent(agent_identity)
-
-            # Remove old tool from agent's tools
-            if name in agent.tools:
-                logger.info(f"Removing old tool: {name}")
-                del agent.tools[name]
-
-            # Remove from sys.modules if loaded
-            module_name = f"{agent_identity.id}.{name}"
-            if module_name in sys.modules:
-                logger.info(f"Removing module from sys.modules: {module_name}")
-                del sys.modules[module_name]
+            # Remove the old tool from the agent and sys.modules
+            self._unload_tool(name, agent_identity)
 
             # Save updated tool file
-            with open(file_path, "w") as f:
-                f.write(final_code)
+            _write_tool_file(file_path, code)
+            _compile_tool_file(file_path)
             logger.info(f"Successfully wrote updated tool file {file_path}")
 
             # Reload the tool
@@ -414,9 +506,29 @@ class ToolCreationContext(Context):
         """
         self.id = state["id"]
 
-        # Reload all tools
-        for tool_name in self.list_available_tools(agent_identity.id):
-            try:
-                self.load_tool(tool_name, agent_identity)
-            except Exception:
-                pass  # Skip failed tools
+        tool_names = self.list_available_tools(agent_identity.id)
+        if not tool_names:
+            return
+
+        # Read and execute the tool files concurrently, then register the tools
+        # from this thread since agent registration is not thread-safe
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_RELOAD_WORKERS, len(tool_names))
+        ) as executor:
+            modules = list(
+                executor.map(
+                    lambda tool_name: self._try_load_tool_module(
+                        tool_name, agent_identity
+                    ),
+                    tool_names,
+                )
+            )
+
+        # Skip failed tools
+        agent = agent_registry.get_agent(agent_identity)
+        agent.register_tools(
+            getattr(module, attr_name)
+            for module in modules
+            if module is not None
+            for attr_name in module_tool_names(module)
+        )
@@ -1,10 +1,12 @@
 """UI components for debugging contexts."""
 
-import json
+import functools
+import html
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
-from nicegui import ui
+import orjson
 
 from swarmer.contexts.crypto_context import CryptoContext
 from swarmer.contexts.memory_context import MemoryContext
@@ -12,6 +14,65 @@ from swarmer.contexts.persona_context import PersonaContext
 from swarmer.contexts.tool_creation_context import ToolCreationContext
 from swarmer.swarmer_types import AgentIdentity, Context, Message
 
+# Seconds a faucet balance is shown before it is fetched from the node again
+_BALANCE_TTL = 5.0
+
+# Faucet balances in ether by address, with the monotonic time they were fetched
+_balance_cache: Dict[str, Tuple[float, Any]] = {}
+
+# HTML fragments for the memory and persona views, filled in with str.format
+_SECTION_FOOTER = "</div></div>"
+
+_MEMORY_HEADER = """
+        <div class="context-section memory-context">
+            <h3>Memory Context</h3>
+            <div class="memories">
+        """
+_AGENT_MEMORIES_HEADER = "<div class='agent-memories'><h4>Agent: {agent_id}</h4>"
+_MEMORY_ENTRY = """
+                <div class="memory-entry">
+                    <div class="memory-header">
+                        <span class="importance">Importance: {importance}</span>
+                    </div>
+                    <div class="memory-content">{content}</div>
+                    <div class="memory-meta">
+                        ID: {memory_id}
+                    </div>
+                </div>
+                """
+
+_PERSONA_HEADER = """
+        <div class="context-section persona-context">
+            <h3>Persona Context</h3>
+            <div class="personas">
+        """
+_PERSONA_ENTRY = """
+            <div class="persona-entry">
+                <h4>{name}</h4>
+                <div class="persona-content">{instruction}</div>
+                <div class="persona-meta">
+                    Description: {description}<br>
+                    ID: {persona_id}
+                </div>
+            </div>
+            """
+
+
+@functools.lru_cache(maxsize=1024)
+def _escape_text(text: str) -> str:
+    """Escape user-supplied text for embedding in an HTML element.
+
+    Results are cached by text, since the same memories and personas are shown
+    on every refresh of the debug page.
+
+    Args:
+        text: The text to escape.
+
+    Returns:
+        The text with HTML special characters escaped.
+    """
+    return html.escape(text, quote=False)
+
 
 class ContextDebugUI(ABC):
     """Abstract base class for context debug UI components."""
@@ -25,6 +86,15 @@ class ContextDebugUI(ABC):
         """
         pass
 
+    def revision(self) -> Optional[Hashable]:
+        """Get a key that changes whenever the rendered view would change.
+
+        Returns:
+            The revision of the displayed state, or None if the view must be
+            rendered every time.
+        """
+        return None
+
     @staticmethod
     def get_ui_for_context(context: Context) -> Optional["ContextDebugUI"]:
         """Get the appropriate UI component for a given context.
@@ -35,14 +105,11 @@ class ContextDebugUI(ABC):
         Returns:
             A UI component for the context, or None if no UI is available.
         """
-        if isinstance(context, MemoryContext):
-            return MemoryContextUI(context)
-        elif isinstance(context, PersonaContext):
-            return PersonaContextUI(context)
-        elif isinstance(context, CryptoContext):
-            return CryptoContextUI(context)
-        elif isinstance(context, ToolCreationContext):
-            return ToolCreationContextUI(context)
+        # Walk the MRO so subclasses of a context get its UI, like isinstance
+        for context_class in type(context).__mro__:
+            ui_class = _CONTEXT_UI_CLASSES.get(context_class)
+            if ui_class is not None:
+                return ui_class(context)
         return None
 
     @staticmethod
@@ -65,7 +132,7 @@ class ContextDebugUI(ABC):
                 html += f"""
                 <div class='tool-call'>
                     <div class='tool-name'>{tool_call.function.name}</div>
-                    <pre class='tool-args'>{json.dumps(json.loads(tool_call.function.arguments), indent=2)}</pre>
+                    <pre class='tool-args'>{orjson.dumps(orjson.loads(tool_call.function.arguments), option=orjson.OPT_INDENT_2).decode()}</pre>
                 </div>
                 """
             html += "</div>"
@@ -91,38 +158,30 @@ class MemoryContextUI(ContextDebugUI):
         """
         self.context = context
 
+    def revision(self) -> Optional[Hashable]:
+        """Get the revision of the displayed memories."""
+        return self.context.revision
+
     def render(self) -> str:
         """Generate the HTML representation of the memory context debug view.
 
         Returns:
             HTML string representation of the memory context.
         """
-        memories = self.context.agent_memories
-
-        html = """
-        <div class="context-section memory-context">
-            <h3>Memory Context</h3>
-            <div class="memories">
-        """
-
-        for agent_id, agent_memories in memories.items():
-            html += f"<div class='agent-memories'><h4>Agent: {agent_id}</h4>"
-            for memory_id, memory in agent_memories.items():
-                html += f"""
-                <div class="memory-entry">
-                    <div class="memory-header">
-                        <span class="importance">Importance: {memory.importance}</span>
-                    </div>
-                    <div class="memory-content">{memory.content}</div>
-                    <div class="memory-meta">
-                        ID: {memory_id}
-                    </div>
-                </div>
-                """
-            html += "</div>"
-
-        html += "</div></div>"
-        return html
+        parts = [_MEMORY_HEADER]
+        for agent_id, agent_memories in self.context.agent_memories.items():
+            parts.append(_AGENT_MEMORIES_HEADER.format(agent_id=agent_id))
+            parts.extend(
+                _MEMORY_ENTRY.format(
+                    importance=memory.importance,
+                    content=_escape_text(memory.content),
+                    memory_id=memory_id,
+                )
+                for memory_id, memory in agent_memories.items()
+            )
+            parts.append("</div>")
+        parts.append(_SECTION_FOOTER)
+        return "".join(parts)
 
 
 class PersonaContextUI(ContextDebugUI):
@@ -136,34 +195,28 @@ class PersonaContextUI(ContextDebugUI):
         """
         self.context = context
 
+    def revision(self) -> Optional[Hashable]:
+        """Get the revision of the displayed personas."""
+        return self.context.revision
+
     def render(self) -> str:
         """Render the persona context debug view.
 
         Returns:
             HTML string representation of the persona context.
         """
-        personas = self.context.persona_collection
-
-        html = """
-        <div class="context-section persona-context">
-            <h3>Persona Context</h3>
-            <div class="personas">
-        """
-
-        for persona_id, persona in personas.items():
-            html += f"""
-            <div class="persona-entry">
-                <h4>{persona.name}</h4>
-                <div class="persona-content">{persona.instruction}</div>
-                <div class="persona-meta">
-                    Description: {persona.description}<br>
-                    ID: {persona_id}
-                </div>
-            </div>
-            """
-
-        html += "</div></div>"
-        return html
+        parts = [_PERSONA_HEADER]
+        parts.extend(
+            _PERSONA_ENTRY.format(
+                name=_escape_text(persona.name),
+                instruction=_escape_text(persona.instruction),
+                description=_escape_text(persona.description),
+                persona_id=persona_id,
+            )
+            for persona_id, persona in self.context.persona_collection.items()
+        )
+        parts.append(_SECTION_FOOTER)
+        return "".join(parts)
 
 
 class CryptoContextUI(ContextDebugUI):
@@ -183,9 +236,7 @@ class CryptoContextUI(ContextDebugUI):
         Returns:
             HTML string representation of the crypto context.
         """
-        balance = self.context.w3.from_wei(
-            self.context.w3.eth.get_balance(self.context.faucet_address), "ether"
-        )
+        balance = self._faucet_balance()
 
         return f"""
         <div class="context-section crypto-context">
@@ -206,6 +257,26 @@ class CryptoContextUI(ContextDebugUI):
         </div>
         """
 
+    def _faucet_balance(self) -> Any:
+        """Get the faucet balance in ether, fetching it at most once per TTL.
+
+        The debug view is rendered on every refresh, so the balance is reused
+        for a few seconds instead of issuing an RPC call each time.
+
+        Returns:
+            The faucet balance in ether.
+        """
+        address = self.context.faucet_address
+        now = time.monotonic()
+        cached = _balance_cache.get(address)
+        if cached is not None and now - cached[0] < _BALANCE_TTL:
+            return cached[1]
+
+        w3 = self.context.w3
+        balance = w3.from_wei(w3.eth.get_balance(address), "ether")
+        _balance_cache[address] = (now, balance)
+        return balance
+
 
 class ToolCreationContextUI(ContextDebugUI):
     """UI component for displaying tool creation context debug information."""
@@ -324,6 +395,15 @@ class ToolCreationContextUI(ContextDebugUI):
         return html
 
 
+# UI component for each context class, looked up by get_ui_for_context
+_CONTEXT_UI_CLASSES: Dict[type, Callable[[Any], ContextDebugUI]] = {
+    MemoryContext: MemoryContextUI,
+    PersonaContext: PersonaContextUI,
+    CryptoContext: CryptoContextUI,
+    ToolCreationContext: ToolCreationContextUI,
+}
+
+
 def create_context_card(context: Context, agent_identity: AgentIdentity) -> None:
     """Create a UI card for displaying context information.
 
@@ -331,6 +411,8 @@ def create_context_card(context: Context, agent_identity: AgentIdentity) -> None
         context: The context to display.
         agent_identity: The identity of the agent.
     """
+    from nicegui import ui
+
     with ui.card():
         ui.label(f"Context: {context.__class__.__name__}")
         display_context_info(context, agent_identity)
@@ -343,6 +425,8 @@ def display_context_info(context: Context, agent_identity: AgentIdentity) -> Non
         context: The context to display information for.
         agent_identity: The identity of the agent.
     """
+    from nicegui import ui
+
     instructions = context.get_context_instructions(agent_identity)
     if instructions:
         with ui.expansion("Instructions", value=True):
@@ -364,6 +448,8 @@ class ContextInstructionsTab:
 
     def render(self) -> None:
         """Render the instructions tab content."""
+        from nicegui import ui
+
         instructions = self.context.get_context_instructions(self.agent_identity)
         if instructions:
             ui.markdown(instructions)
@@ -1,304 +1,51 @@
 """Server component for the debug UI."""
 
+import hashlib
+import os
 import threading
-from typing import Dict, Optional, cast
+from pathlib import Path
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple, cast
 
-from flask import Flask, abort, render_template_string
+from flask import Flask, Response, abort, request
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup, escape
 
 from swarmer.agent import Agent
 from swarmer.debug_ui.context_ui import ContextDebugUI
-from swarmer.swarmer_types import Context
-
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Agent Debug UI - {{ agent.identity.name }}</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: #f5f5f5;
-        }
-
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-
-        .header {
-            display: flex;
-            justify-content: space-between;
-            align-items: start;
-            margin-bottom: 20px;
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        .token-usage {
-            text-align: right;
-            padding: 10px;
-            background: #f8f9fa;
-            border-radius: 5px;
-        }
-
-        .token-usage h3 {
-            margin-top: 0;
-        }
-
-        .tabs {
-            background: white;
-            padding: 10px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-
-        .tab-buttons {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            border-bottom: 1px solid #dee2e6;
-            padding-bottom: 10px;
-        }
-
-        .tab-button {
-            padding: 10px 20px;
-            border: none;
-            background: none;
-            cursor: pointer;
-            font-size: 16px;
-            border-radius: 5px;
-            transition: all 0.2s;
-        }
-
-        .tab-button:hover {
-            background: #f8f9fa;
-        }
-
-        .tab-button.active {
-            background: #007bff;
-            color: white;
-        }
-
-        .tab-content {
-            display: none;
-            padding: 20px;
-            background: white;
-            border-radius: 5px;
-        }
-
-        .tab-content.active {
-            display: block;
-        }
-
-        /* Message styles */
-        .message {
-            padding: 15px;
-            margin: 10px 0;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }
-
-        .user { background-color: #e3f2fd; }
-        .assistant { background-color: #f8f9fa; }
-        .system { background-color: #fff3e0; }
-        .tool { background-color: #e8f5e9; }
-
-        /* Tools section */
-        .tool-entry {
-            margin: 15px 0;
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border-left: 4px solid #007bff;
-        }
-
-        /* Context sections */
-        .context-section {
-            margin: 15px 0;
-            padding: 15px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }
-
-        /* Utility classes */
-        .metadata { font-size: 0.9em; color: #666; }
-        .content { white-space: pre-wrap; }
-        code {
-            background: #e9ecef;
-            padding: 2px 4px;
-            border-radius: 3px;
-            font-family: monospace;
-        }
-    </style>
-    <script>
-        function showTab(tabId) {
-            // Save active tab to localStorage
-            localStorage.setItem('activeTab', tabId);
-
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {
-                tab.classList.remove('active');
-            });
-
-            // Remove active class from all buttons
-            document.querySelectorAll('.tab-button').forEach(button => {
-                button.classList.remove('active');
-            });
-
-            // Show selected tab
-            document.getElementById(tabId).classList.add('active');
-            document.querySelector(`[onclick="showTab('${tabId}')"]`).classList.add('active');
-        }
-
-        // Handle message view toggle
-        document.addEventListener('DOMContentLoaded', function() {
-            const checkbox = document.getElementById('showFullSequence');
-            const savedState = localStorage.getItem('showFullSequence');
-            checkbox.checked = savedState === 'true';
-            toggleMessageView();
-
-            // Restore active tab
-            const activeTab = localStorage.getItem('activeTab') || 'messages-tab';
-            showTab(activeTab);
-        });
-
-        function toggleMessageView() {
-            const checkbox = document.getElementById('showFullSequence');
-            const standardView = document.getElementById('standardMessages');
-            const fullView = document.getElementById('fullSequence');
-            localStorage.setItem('showFullSequence', checkbox.checked);
-
-            if (checkbox.checked) {
-                standardView.style.display = 'none';
-                fullView.style.display = 'block';
-            } else {
-                standardView.style.display = 'block';
-                fullView.style.display = 'none';
-            }
-        }
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Agent: {{ agent.identity.name }}</h1>
-            <div class="token-usage">
-                <h3>Token Usage</h3>
-                <p>Prompt tokens: {{ agent.token_usage['prompt_tokens'] }}</p>
-                <p>Completion tokens: {{ agent.token_usage['completion_tokens'] }}</p>
-                <p>Total tokens: {{ agent.token_usage['total_tokens'] }}</p>
-            </div>
-        </div>
-
-        <div class="tabs">
-            <div class="tab-buttons">
-                <button class="tab-button active" onclick="showTab('messages-tab')">Messages</button>
-                <button class="tab-button" onclick="showTab('tools-tab')">Tools</button>
-                <button class="tab-button" onclick="showTab('contexts-tab')">Contexts</button>
-            </div>
-
-            <div id="messages-tab" class="tab-content active">
-                <div class="message-controls">
-                    <label class="toggle">
-                        <input type="checkbox" id="showFullSequence" onchange="toggleMessageView()">
-                        Show Full Message Sequence
-                    </label>
-                </div>
-
-                <div id="standardMessages" class="messages">
-                    {% for message in agent.message_log %}
-                        <div class="message {{ message.role }}">
-                            <div class="metadata">
-                                <strong>Role:</strong> {{ message.role }}
-                                {% if message.tool_call_id %}
-                                    <br><strong>Tool Call ID:</strong> {{ message.tool_call_id }}
-                                {% endif %}
-                            </div>
-                            <div class="content">{{ message.content }}</div>
-                        </div>
-                    {% endfor %}
-                </div>
-
-                <div id="fullSequence" class="messages" style="display: none;">
-                    <div class="message system">
-                        <div class="metadata">
-                            <strong>Role:</strong> system
-                            <br><strong>Type:</strong> Constitution & Instructions
-                        </div>
-                        <div class="content">{{ "\n\n".join([constitution_text] + context_instructions) }}</div>
-                    </div>
-
-                    {% for message in agent.message_log %}
-                        <div class="message {{ message.role }}">
-                            <div class="metadata">
-                                <strong>Role:</strong> {{ message.role }}
-                                {% if message.tool_call_id %}
-                                    <br><strong>Tool Call ID:</strong> {{ message.tool_call_id }}
-                                {% endif %}
-                            </div>
-                            <div class="content">{{ message.content }}</div>
-                        </div>
-                    {% endfor %}
-
-                    <div class="message system">
-                        <div class="metadata">
-                            <strong>Role:</strong> system
-                            <br><strong>Type:</strong> Current Context State
-                        </div>
-                        <div class="content">{{ "\n\n".join(current_context) }}</div>
-                    </div>
-                </div>
-            </div>
-
-            <div id="tools-tab" class="tab-content">
-                <div class="tools">
-                    {% for name, tool in agent.tools.items() %}
-                        <div class="tool-entry">
-                            <h4>{{ name }}</h4>
-                            <div class="tool-schema">
-                                <div class="tool-meta">
-                                    <strong>Description:</strong> {{ tool.__tool_schema__.get('description', 'No description') }}
-                                </div>
-                                {% if tool.__tool_schema__.get('parameters') %}
-                                    <div class="tool-parameters">
-                                        <strong>Parameters:</strong>
-                                        <ul>
-                                        {% for param in tool.__tool_schema__.get('parameters', {}).get('properties', {}).items() %}
-                                            <li>
-                                                <code>{{ param[0] }}</code>
-                                                {% if param[1].get('type') %}
-                                                    <span class="param-type">({{ param[1]['type'] }})</span>
-                                                {% endif %}
-                                                {% if param[1].get('description') %}
-                                                    <br>
-                                                    <span class="param-desc">{{ param[1]['description'] }}</span>
-                                                {% endif %}
-                                            </li>
-                                        {% endfor %}
-                                        </ul>
-                                    </div>
-                                {% endif %}
-                            </div>
-                        </div>
-                    {% endfor %}
-                </div>
-            </div>
-
-            <div id="contexts-tab" class="tab-content">
-                {% for context in agent.contexts.values() %}
-                    {{ context_uis.get(context.id, '') | safe }}
-                {% endfor %}
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
+from swarmer.globals.constitution import constitution
+from swarmer.swarmer_types import Context, Message
+
+# Seconds browsers may cache the debug UI stylesheet, its URL changes with it
+_STATIC_MAX_AGE = 86400
+
+# Template output chunks buffered together before being sent while streaming
+_STREAM_BUFFER_SIZE = 5
+
+# Number of most recent messages shown on an agent page, more can be requested
+_MESSAGE_WINDOW = int(os.getenv("SWARMER_DEBUG_MESSAGE_WINDOW", "200"))
+
+# Tool name, description and (name, type, description) of each parameter
+ToolView = Tuple[str, str, List[Tuple[str, str, str]]]
+
+
+def _snapshot_messages(message_log: Deque[Message]) -> List[Message]:
+    """Copy a message log that an agent thread may be changing.
+
+    Iterating a deque raises if it is mutated meanwhile, so the copy is retried
+    until it completes. The log is capped, which keeps each attempt short.
+
+    Args:
+        message_log: The agent's message log.
+
+    Returns:
+        The messages in the log, oldest first.
+    """
+    while True:
+        try:
+            return list(message_log)
+        except RuntimeError:
+            # The agent appended or trimmed messages during the copy
+            continue
 
 
 class DebugUIServer:
@@ -317,9 +64,32 @@ class DebugUIServer:
         """
         self.port = port
         self.agents: Dict[int, Agent] = {}
-        self.app = Flask(__name__)
+        self.app = Flask(
+            __name__, static_folder="static", static_url_path="/debug-static"
+        )
+        self.app.config["SEND_FILE_MAX_AGE_DEFAULT"] = _STATIC_MAX_AGE
         self.server_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Rendered context views by user id and context id, with the revision
+        # they show
+        self._ui_cache: Dict[int, Dict[str, Tuple[Hashable, Markup]]] = {}
+        # Flattened tool listings by user id, with the schema list they came from
+        self._tools_views: Dict[int, Tuple[Any, List[ToolView]]] = {}
+        # Escaped system text by user id, with the texts it was built from
+        self._system_texts: Dict[int, Tuple[str, str, Markup]] = {}
+
+        # Compile the templates once instead of on every request, caching the
+        # compiled bytecode on disk so restarts skip compiling them as well
+        jinja_env = self.app.jinja_env
+        jinja_env.bytecode_cache = FileSystemBytecodeCache()
+        jinja_env.auto_reload = False
+        # Versioned by content, so a changed stylesheet is never served from cache
+        stylesheet = Path(self.app.static_folder or "", "debug.css").read_bytes()
+        jinja_env.globals["css_version"] = hashlib.blake2b(
+            stylesheet, digest_size=8
+        ).hexdigest()
+        self._agent_list_template = jinja_env.get_template("agent_list.html")
+        self._agent_template = jinja_env.get_template("agent.html")
 
         @self.app.route("/")
         def home() -> str:
@@ -327,92 +97,227 @@ class DebugUIServer:
             agent_list = {
                 user_id: agent.identity.name for user_id, agent in self.agents.items()
             }
-            return render_template_string(
-                """
-                <html>
-                <head>
-                    <title>Agent Debug UI</title>
-                    <style>
-                        body {
-                            font-family: Arial, sans-serif;
-                            margin: 0;
-                            padding: 20px;
-                            background: #f5f5f5;
-                        }
-                        .agent-list {
-                            max-width: 800px;
-                            margin: 0 auto;
-                        }
-                        .agent-entry {
-                            background: white;
-                            padding: 15px;
-                            margin: 10px 0;
-                            border-radius: 8px;
-                            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                        }
-                        a {
-                            color: #007bff;
-                            text-decoration: none;
-                        }
-                        a:hover {
-                            text-decoration: underline;
-                        }
-                    </style>
-                </head>
-                <body>
-                    <div class="agent-list">
-                        <h1>Active Agents</h1>
-                        {% for user_id, name in agents.items() %}
-                            <div class="agent-entry">
-                                <h3>{{ name }}</h3>
-                                <p>User ID: {{ user_id }}</p>
-                                <a href="/agent/{{ user_id }}">View Details →</a>
-                            </div>
-                        {% else %}
-                            <p>No active agents</p>
-                        {% endfor %}
-                    </div>
-                </body>
-                </html>
-                """,
-                agents=agent_list,
-            )
+            return self._agent_list_template.render(agents=agent_list)
 
         @self.app.route("/agent/<int:user_id>")
-        def agent_details(user_id: int) -> str:
+        def agent_details(user_id: int) -> Response:
             """Display details for a specific agent."""
             agent = self.agents.get(user_id)
             if not agent:
                 abort(404)
 
-            # Create context UIs
-            context_uis = {}
-            if agent and agent.contexts:
-                for context in agent.contexts.values():
-                    # Cast AgentContext to Context for type compatibility
-                    context_ui = ContextDebugUI.get_ui_for_context(
-                        cast(Context, context)
-                    )
-                    if context_ui and hasattr(context, "id"):
-                        context_uis[context.id] = context_ui.render()
-
-            # Get constitution text
-            from swarmer.globals.constitution import constitution
-
-            constitution_text = constitution.instruction
-
-            # Get context instructions and current context
-            context_instructions = agent.get_context_instructions() if agent else []
-            current_context = agent.get_context() if agent else []
-
-            return render_template_string(
-                HTML_TEMPLATE,
-                agent=agent,
-                context_uis=context_uis,
-                constitution_text=constitution_text,
-                context_instructions=context_instructions,
-                current_context=current_context,
+            limit = max(request.args.get("limit", _MESSAGE_WINDOW, type=int), 1)
+            context_uis, view_revisions = self._context_views(user_id, agent)
+            # Contexts such as the time context change without bumping any
+            # version, so their current state is part of the ETag
+            current_context_text = "\n\n".join(agent.get_context())
+            # The page is streamed after this returns, while the agent keeps
+            # running, so it only reads snapshots taken here
+            token_usage = dict(agent.token_usage)
+
+            # Polling browsers revalidate, the ETag is built from version
+            # counters so an unchanged page is answered before building it
+            etag = self._page_etag(
+                agent, limit, view_revisions, current_context_text, token_usage
             )
+            if etag in request.if_none_match:
+                response = Response(status=304)
+            else:
+                system_text = self._system_text(user_id, agent)
+                tools_view = self._tools_view(user_id, agent)
+
+                # Only the most recent messages are rendered, taken from a copy
+                # since the agent may append to its log while the page renders
+                message_log = _snapshot_messages(agent.message_log)
+                messages = message_log[-limit:]
+
+                # Streamed so the browser can start on the head of the page
+                # while the message log is still being rendered
+                stream = self._agent_template.stream(
+                    agent_name=agent.identity.name,
+                    token_usage=token_usage,
+                    messages=messages,
+                    hidden_messages=len(message_log) - len(messages),
+                    limit=limit,
+                    message_window=_MESSAGE_WINDOW,
+                    context_uis=context_uis,
+                    tools_view=tools_view,
+                    system_text=system_text,
+                    current_context_text=current_context_text,
+                )
+                stream.enable_buffering(_STREAM_BUFFER_SIZE)
+                response = Response(stream, mimetype="text/html")
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+
+    @staticmethod
+    def _page_etag(
+        agent: Agent,
+        limit: int,
+        view_revisions: Dict[str, Hashable],
+        current_context_text: str,
+        token_usage: Dict[str, int],
+    ) -> str:
+        """Compute the ETag of an agent page from the versions of what it displays.
+
+        The agent bumps its version counters whenever its messages, tools,
+        contexts or context state change, so the rest of the page does not have
+        to be built to tell whether it changed. The current context is hashed
+        as is, since it can change without any of them.
+
+        Args:
+            agent: The agent shown on the page.
+            limit: The number of most recent messages shown.
+            view_revisions: The revision of each context view, by context id.
+            current_context_text: The current context of the agent.
+            token_usage: The token usage shown on the page.
+
+        Returns:
+            The ETag for the page.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            repr(
+                (
+                    agent.identity.id,
+                    agent.identity.name,
+                    limit,
+                    agent._message_log_version,
+                    agent._tools_version,
+                    agent._contexts_version,
+                    agent._context_epoch,
+                    tuple(token_usage.values()),
+                    hash(constitution.instruction),
+                )
+            ).encode()
+        )
+        for context_id, revision in view_revisions.items():
+            digest.update(f"{context_id}\0{revision}\0".encode())
+        digest.update(current_context_text.encode())
+        return digest.hexdigest()
+
+    def _system_text(self, user_id: int, agent: Agent) -> Markup:
+        """Get the constitution and context instructions as escaped HTML.
+
+        The agent returns the same instructions string until its contexts
+        change, so the text is only joined and escaped again after that.
+
+        Args:
+            user_id: The user id the agent is registered under.
+            agent: The agent whose instructions are shown.
+
+        Returns:
+            The escaped system text.
+        """
+        constitution_text = constitution.instruction
+        instructions_text = agent.get_context_instructions_text("\n\n")
+        cached = self._system_texts.get(user_id)
+        if (
+            cached is not None
+            and cached[0] is constitution_text
+            and cached[1] is instructions_text
+        ):
+            return cached[2]
+
+        system_text = escape(constitution_text)
+        if instructions_text:
+            # Markup escapes the appended text
+            system_text += "\n\n" + instructions_text
+        self._system_texts[user_id] = (
+            constitution_text,
+            instructions_text,
+            system_text,
+        )
+        return system_text
+
+    def _tools_view(self, user_id: int, agent: Agent) -> List[ToolView]:
+        """Get the agent's tools flattened for the tools tab.
+
+        The agent returns the same schema list until its tools change, so the
+        flattened view is only rebuilt after that.
+
+        Args:
+            user_id: The user id the agent is registered under.
+            agent: The agent whose tools are listed.
+
+        Returns:
+            The name, description and parameters of each tool.
+        """
+        schemas = agent.get_tool_schemas()
+        cached = self._tools_views.get(user_id)
+        if cached is not None and cached[0] is schemas:
+            return cached[1]
+
+        tools_view = []
+        for name, tool in agent.tools.items():
+            function = getattr(tool, "__tool_schema__", {}).get("function", {})
+            properties = function.get("parameters", {}).get("properties", {})
+            tools_view.append(
+                (
+                    name,
+                    function.get("description") or "No description",
+                    [
+                        (
+                            param_name,
+                            param.get("type", ""),
+                            param.get("description", ""),
+                        )
+                        for param_name, param in properties.items()
+                    ],
+                )
+            )
+
+        self._tools_views[user_id] = (schemas, tools_view)
+        return tools_view
+
+    def _context_views(
+        self, user_id: int, agent: Agent
+    ) -> Tuple[Dict[str, Markup], Dict[str, Hashable]]:
+        """Render the views of the agent's contexts, reusing unchanged ones.
+
+        Views are cached per context with the revision they show. Only the views
+        of the agent's current contexts are kept, so views of contexts that were
+        removed or replaced are dropped. The HTML is wrapped as Markup once here,
+        so the template embeds it as is without a safe filter.
+
+        Args:
+            user_id: The user id the agent is registered under.
+            agent: The agent whose contexts are shown.
+
+        Returns:
+            HTML representation of each context with a view, and the revision
+            each view shows, by context id. Views without a revision are
+            rendered every time and stand for their own revision.
+        """
+        cached_views = self._ui_cache.get(user_id, {})
+        current_views: Dict[str, Tuple[Hashable, Markup]] = {}
+        context_uis: Dict[str, Markup] = {}
+        view_revisions: Dict[str, Hashable] = {}
+        for context in agent.contexts.values():
+            # Cast AgentContext to Context for type compatibility
+            context_ui = ContextDebugUI.get_ui_for_context(cast(Context, context))
+            if context_ui is None or not hasattr(context, "id"):
+                continue
+
+            revision = context_ui.revision()
+            if revision is None:
+                html = Markup(context_ui.render())
+                context_uis[context.id] = view_revisions[context.id] = html
+                continue
+
+            # Contexts restored from the same state share an id, so the object
+            # is part of the key as well
+            key = (id(context), revision)
+            cached = cached_views.get(context.id)
+            if cached is None or cached[0] != key:
+                cached = (key, Markup(context_ui.render()))
+            current_views[context.id] = cached
+            context_uis[context.id] = cached[1]
+            view_revisions[context.id] = revision
+
+        self._ui_cache[user_id] = current_views
+        return context_uis, view_revisions
 
     def register_agent(self, agent: Agent) -> None:
         """Register an agent with the debug UI server.
@@ -430,7 +335,11 @@ class DebugUIServer:
             agent: The agent to unregister.
         """
         if hasattr(agent.identity, "user_id"):
-            self.agents.pop(int(agent.identity.user_id), None)
+            user_id = int(agent.identity.user_id)
+            self.agents.pop(user_id, None)
+            self._ui_cache.pop(user_id, None)
+            self._tools_views.pop(user_id, None)
+            self._system_texts.pop(user_id, None)
 
     def start(self) -> None:
         """Start the debug UI server in a separate thread."""
@@ -442,7 +351,8 @@ class DebugUIServer:
         """Run the Flask server in the background thread."""
         from werkzeug.serving import make_server
 
-        self.server = make_server("127.0.0.1", self.port, self.app)
+        # Threaded so a slow render does not hold up other polling requests
+        self.server = make_server("127.0.0.1", self.port, self.app, threaded=True)
         self.server.serve_forever()
 
     def run(self) -> None:
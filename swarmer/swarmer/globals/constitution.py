@@ -16,6 +16,8 @@ class Constitution(ConstitutionBase):
     consistent behavior across all agent instances.
     """
 
+    __slots__ = ()
+
     def __init__(self, instruction: str) -> None:
         """Initialize the constitution with default rules."""
         self.instruction = instruction
@@ -10,6 +10,24 @@ import hashlib
 from swarmer.swarmer_types import InstructionBase
 
 
+def _instruction_id(name: str, instruction: str) -> str:
+    """Derive the id of an instruction from its name and text.
+
+    BLAKE2b with a 160-bit digest is used since the id only needs to tell
+    instructions apart, and it hashes faster than SHA-256.
+
+    Args:
+        name: The name of the instruction.
+        instruction: The text of the instruction.
+
+    Returns:
+        The hex digest identifying the instruction.
+    """
+    return hashlib.blake2b(
+        f"{name}:::{instruction}".encode(), digest_size=20
+    ).hexdigest()
+
+
 class Instruction(InstructionBase):
     """Base class for agent behavior instructions.
 
@@ -32,7 +50,7 @@ class Instruction(InstructionBase):
             name: A unique name for the instruction.
         """
         # TODO: (vulnerability) fix this hash to avoid collisions
-        self.id = hashlib.sha256(f"{name}:::{instruction}".encode()).hexdigest()
+        self.id = _instruction_id(name, instruction)
         self.instruction = instruction
         self.description = description
         self.name = name
@@ -48,6 +66,7 @@ class Persona(InstructionBase):
         instruction: The text of the instruction.
         description: A brief description of the instruction.
         name: A unique name for the instruction.
+        short_id: The first 16 characters of the id, used in tool names.
     """
 
     def __init__(self, instruction: str, description: str, name: str) -> None:
@@ -59,7 +78,8 @@ class Persona(InstructionBase):
             name: A unique name for the instruction.
         """
         # TODO: (vulnerability) fix this hash to avoid collisions
-        self.id = hashlib.sha256(f"{name}:::{instruction}".encode()).hexdigest()
+        self.id = _instruction_id(name, instruction)
+        self.short_id = self.id[:16]
         self.instruction = instruction
         self.description = description
         self.name = name
@@ -2,7 +2,16 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    runtime_checkable,
+)
 from uuid import uuid4
 
 from litellm import Message as AnnoyingMessage
@@ -46,6 +55,9 @@ class Message(AnnoyingMessage):
 class AgentIdentity:
     """Identity information for an agent."""
 
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ("id", "user_id", "name")
+
     id: str
     user_id: str
     name: str
@@ -57,7 +69,7 @@ class AgentIdentity:
             name: The name of the agent.
             user_id: The ID of the user who owns this agent.
         """
-        self.id = str(uuid4())
+        self.id = uuid4().hex
         self.name = name
         self.user_id = user_id
 
@@ -127,7 +139,7 @@ class Context(AgentContext, ABC):
     def __init__(self) -> None:
         """Initialize a context with default settings."""
         self.tools: List[Tool] = []
-        self.id: str = str(uuid4())
+        self.id: str = uuid4().hex
 
     @abstractmethod
     def get_context(self, agent: AgentIdentity) -> Dict[str, Any]:
@@ -176,6 +188,8 @@ class Context(AgentContext, ABC):
 class AgentBase(ABC):
     """Abstract base class representing an AI agent with its capabilities and settings."""
 
+    __slots__ = ()
+
     identity: AgentIdentity
     contexts: Dict[str, AgentContext]
     tools: Dict[str, Tool]
@@ -212,6 +226,11 @@ class AgentBase(ABC):
         """Register a new tool."""
         pass
 
+    @abstractmethod
+    def register_tools(self, tools: Iterable[Tool]) -> None:
+        """Register several tools at once."""
+        pass
+
     @abstractmethod
     def unregister_tool(self, tool_name: str) -> None:
         """Remove a tool."""
@@ -228,6 +247,8 @@ class Constitution(ABC):
         instruction: The text containing the agent's behavioral rules.
     """
 
+    __slots__ = ("instruction",)
+
     def __init__(self, instruction: str) -> None:
         """Initialize the constitution.
 
@@ -26,7 +26,7 @@ def create_agent(
         A ToolResponse containing the result of the agent creation.
     """
     agent = Agent(name, token_budget, model)
-    agent_registry.registry[agent_identity.id] = agent
+    agent_registry.registry[agent.identity.id] = agent
 
     return ToolResponse(
         summary=f"Created new agent '{name}' with ID: {agent.identity.id}",
@@ -7,13 +7,31 @@ installation, verification, and dependency graph management.
 import importlib
 import subprocess
 import sys
+import threading
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import runtime_checkable
 
 T_co = TypeVar("T_co", covariant=True)
 
+# Held while installing, read-only tools with dependencies can run concurrently
+_install_lock = threading.Lock()
+
+# Package specs installed by this process, their import name can differ
+_installed: Set[str] = set()
+
 
 @runtime_checkable
 class ToolFunction(Protocol[T_co]):
@@ -75,24 +93,49 @@ def requires(
     return decorator
 
 
-def ensure_dependencies(dependencies: List[tuple[str, Optional[str]]]) -> None:
-    """Ensure all required packages are installed.
+def _missing_packages(dependencies: List[tuple[str, Optional[str]]]) -> List[str]:
+    """Get the specs of the packages that are not installed yet.
 
     Args:
         dependencies: List of (package_name, version_spec) tuples
+
+    Returns:
+        The package specs to install.
     """
     missing = []
     for package, version in dependencies:
         spec = f"{package}{version if version else ''}"
+        if spec in _installed:
+            continue
         try:
             importlib.import_module(package.replace("-", "_"))
         except ImportError:
             missing.append(spec)
+    return missing
+
+
+def ensure_dependencies(dependencies: List[tuple[str, Optional[str]]]) -> None:
+    """Ensure all required packages are installed.
+
+    Installs run one at a time, so concurrent tool calls never run pip on the
+    same site-packages at once.
+
+    Args:
+        dependencies: List of (package_name, version_spec) tuples
+    """
+    if not _missing_packages(dependencies):
+        return
+
+    with _install_lock:
+        # Another tool call may have installed them while this one waited
+        missing = _missing_packages(dependencies)
+        if not missing:
+            return
 
-    if missing:
         try:
             subprocess.check_call(
                 [sys.executable, "-m", "pip", "install", "--quiet", *missing]
             )
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to install dependencies: {e}")
+        _installed.update(missing)
@@ -6,10 +6,11 @@ the results in a format suitable for agent consumption.
 
 from swarmer.swarmer_types import AgentIdentity
 from swarmer.tools.dependencies import requires
-from swarmer.tools.utils import ToolResponse, tool
+from swarmer.tools.utils import ToolResponse, read_only, tool
 
 
 @requires("googlesearch-python")
+@read_only
 @tool
 def search_google(
     agent_identity: AgentIdentity, query: str, num_results: int = 5
@@ -0,0 +1,76 @@
+"""Loading of agent tool modules from their source files.
+
+Agents load the tools in their tools directory on creation, and the tool
+creation context loads tools as they are created, updated and restored. Both go
+through this module, so a tool file is only executed again once it changed.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import List
+
+
+def load_tool_module(module_name: str, file_path: Path) -> ModuleType:
+    """Load a tool module from its file, reusing it while the file is unchanged.
+
+    Loaded modules are kept in sys.modules, together with the path, size and
+    modification time of the file they were executed from. The module is
+    executed again when any of these changed, or when it was removed from
+    sys.modules, as creating, updating and removing a tool do since a rewrite
+    can keep both the size and the coarse file system mtime.
+
+    Args:
+        module_name: The name to load the module under.
+        file_path: The path of the tool file.
+
+    Returns:
+        The loaded tool module.
+
+    Raises:
+        ImportError: If no module spec can be created for the file.
+    """
+    stat = file_path.stat()
+    source = (str(file_path), stat.st_size, stat.st_mtime_ns)
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__swarmer_source__", None) == source:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module spec for {module_name}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a partially executed module behind for the next load
+        sys.modules.pop(module_name, None)
+        raise
+    module.__swarmer_source__ = source  # type: ignore[attr-defined]
+    return module
+
+
+def module_tool_names(module: ModuleType) -> List[str]:
+    """Get the names of the tools a loaded tool module defines.
+
+    The names are stored on the module, so registering the tools of a module
+    that was already loaded skips the dir() and getattr sweep.
+
+    Args:
+        module: The loaded tool module.
+
+    Returns:
+        The names of the module attributes that are tools.
+    """
+    names = getattr(module, "__swarmer_tools__", None)
+    if names is None:
+        names = [
+            attr_name
+            for attr_name in dir(module)
+            if hasattr(getattr(module, attr_name), "__tool_schema__")
+        ]
+        module.__swarmer_tools__ = names  # type: ignore[attr-defined]
+    return names
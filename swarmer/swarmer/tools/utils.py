@@ -5,24 +5,48 @@ response handling, schema generation, and tool decorators.
 """
 
 import inspect
+import weakref
 from functools import update_wrapper
+from types import FunctionType
 from typing import (
     Any,
     Callable,
+    Dict,
     List,
     Optional,
     Protocol,
+    Tuple,
     TypeVar,
     Union,
     cast,
     runtime_checkable,
 )
 
-from swarmer.tools.dependencies import ensure_dependencies
 from swarmer.tools.types import Tool, ToolableType, ToolResponse
 
 T_co = TypeVar("T_co", covariant=True)
 
+# JSON schema type for each supported parameter annotation, built once at import
+_TYPE_MAP = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    type(None): "null",
+}
+
+# Code flags of functions whose parameters cannot be read from the code object
+_VARIADIC_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+# Schemas already generated for a function, by tool name. Keyed weakly on the
+# function object itself, so functions from reloaded tool modules never hit a
+# stale entry and are not kept alive by the cache.
+_SCHEMA_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, dict]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 @runtime_checkable
 class WrappedTool(Tool, Protocol[T_co]):
@@ -40,25 +64,44 @@ class WrappedTool(Tool, Protocol[T_co]):
     __tool_dependencies__: List[tuple[str, Optional[str]]]
 
 
-def function_to_schema(func: ToolableType, name: str) -> dict:
-    """Convert a function's signature to a JSON schema.
+def _function_parameters(func: ToolableType) -> List[Tuple[str, Any, bool]]:
+    """Get the parameters of a function.
+
+    Plain functions with only positional-or-keyword parameters are read straight
+    from their code object, skipping the Parameter objects inspect.signature
+    builds. Anything else, such as partials, wrapped functions and functions
+    with variadic or keyword-only parameters, goes through inspect.signature.
 
     Args:
-        func: The function to convert.
-        name: The name of the function.
+        func: The function to inspect.
 
     Returns:
-        A dictionary representing the function's JSON schema.
+        The name, annotation and whether it has a default of each parameter,
+        in order. Unannotated parameters have inspect.Parameter.empty.
+
+    Raises:
+        ValueError: If no signature can be determined for the function.
     """
-    type_map = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-        type(None): "null",
-    }
+    code = getattr(func, "__code__", None)
+    if (
+        type(func) is FunctionType
+        and code is not None
+        and not code.co_kwonlyargcount
+        and not code.co_flags & _VARIADIC_FLAGS
+        and not hasattr(func, "__wrapped__")
+        and not hasattr(func, "__signature__")
+    ):
+        names = code.co_varnames[: code.co_argcount]
+        annotations = func.__annotations__
+        first_default = len(names) - len(func.__defaults__ or ())
+        return [
+            (
+                param_name,
+                annotations.get(param_name, inspect.Parameter.empty),
+                index >= first_default,
+            )
+            for index, param_name in enumerate(names)
+        ]
 
     try:
         signature = inspect.signature(func)
@@ -66,25 +109,61 @@ def function_to_schema(func: ToolableType, name: str) -> dict:
         raise ValueError(
             f"Failed to get signature for function {func.__name__}: {str(e)}"
         )
+    return [
+        (param.name, param.annotation, param.default is not param.empty)
+        for param in signature.parameters.values()
+    ]
+
+
+def function_to_schema(func: ToolableType, name: str) -> dict:
+    """Convert a function's signature to a JSON schema.
+
+    Schemas are cached per function and name, so the returned dictionary may be
+    shared and must not be modified.
+
+    Args:
+        func: The function to convert.
+        name: The name of the function.
+
+    Returns:
+        A dictionary representing the function's JSON schema.
+    """
+    try:
+        schemas = _SCHEMA_CACHE.setdefault(func, {})
+    except TypeError:
+        # Not weakly referenceable, build the schema every time
+        return _build_function_schema(func, name)
+
+    schema = schemas.get(name)
+    if schema is None:
+        schema = schemas[name] = _build_function_schema(func, name)
+    return schema
+
+
+def _build_function_schema(func: ToolableType, name: str) -> dict:
+    """Build the JSON schema for a function's signature.
+
+    Args:
+        func: The function to convert.
+        name: The name of the function.
+
+    Returns:
+        A dictionary representing the function's JSON schema.
+    """
+    params = _function_parameters(func)
 
     parameters = {}
     # We always skip the first param because it's either the self param or the agent_identity param
     # We skip the second param if the first param is self because self is always the first param for methods
     # This is hacky but for some reason inspect.ismethod is false at the time of the tool decorator
-    skip_params = 2 if list(signature.parameters.values())[0].name == "self" else 1
-    for param in list(signature.parameters.values())[skip_params:]:
-        try:
-            param_type = type_map.get(param.annotation, "string")
-        except KeyError as e:
-            raise KeyError(
-                f"Unknown type annotation {param.annotation} for parameter {param.name}: {str(e)}"
-            )
-        parameters[param.name] = {"type": param_type}
+    skip_params = 2 if params[0][0] == "self" else 1
+    for param_name, annotation, _ in params[skip_params:]:
+        parameters[param_name] = {"type": _TYPE_MAP.get(annotation, "string")}
 
     required = [
-        param.name
-        for param in list(signature.parameters.values())[1:]
-        if param.default == inspect._empty
+        param_name
+        for param_name, _, has_default in params[skip_params:]
+        if not has_default
     ]
 
     return {
@@ -101,6 +180,22 @@ def function_to_schema(func: ToolableType, name: str) -> dict:
     }
 
 
+def read_only(func: Tool) -> Tool:
+    """Mark a tool as not changing the state reported by any context.
+
+    Agents skip rebuilding their context after a round of tool calls that only
+    used read-only tools. Apply it on top of the tool decorator.
+
+    Args:
+        func: The tool to mark.
+
+    Returns:
+        The same tool, marked as read-only.
+    """
+    func.__tool_read_only__ = True  # type: ignore
+    return func
+
+
 def tool(func: Callable[..., Union[str, ToolResponse]]) -> Tool:
     """Convert a function into a Swarmer tool.
 
@@ -114,11 +209,9 @@ def tool(func: Callable[..., Union[str, ToolResponse]]) -> Tool:
         A Tool instance wrapping the original function.
     """
 
+    # Only needed to turn plain results into ToolResponses. Dependencies are
+    # checked by the requires wrapper itself, so they are not checked here again
     def wrapper(*args: Any, **kwargs: Any) -> ToolResponse:
-        # Ensure dependencies are installed
-        if hasattr(func, "__tool_dependencies__"):
-            ensure_dependencies(func.__tool_dependencies__)
-
         # Execute the tool function
         result = func(*args, **kwargs)
 
@@ -6,10 +6,11 @@ pages, including text extraction and basic content analysis.
 
 from swarmer.swarmer_types import AgentIdentity
 from swarmer.tools.dependencies import requires
-from swarmer.tools.utils import ToolResponse, tool
+from swarmer.tools.utils import ToolResponse, read_only, tool
 
 
 @requires("requests", "beautifulsoup4")
+@read_only
 @tool
 def read_webpage(
     agent_identity: AgentIdentity, url: str, extract_text: bool = True
@@ -1,10 +1,12 @@
 """Test fixtures."""
 
+from pathlib import Path
 from typing import Any, Dict
 
 import pytest
 
 from swarmer.agent import Agent
+from swarmer.globals.agent_registry import agent_registry
 from swarmer.swarmer_types import AgentIdentity, Context
 
 
@@ -57,3 +59,14 @@ def mock_context() -> MockContext:
 def mock_agent() -> Agent:
     """Create a mock agent."""
     return Agent(name="test_agent", token_budget=1000, model="gpt-3.5-turbo")
+
+
+@pytest.fixture
+def registered_agent(mock_agent: Agent, tmp_path: Path, monkeypatch: Any) -> Agent:
+    """Register the mock agent so context tools can look it up.
+
+    Tools created by contexts set up afterwards are written under tmp_path.
+    """
+    monkeypatch.setenv("AGENT_TOOLS_DIRECTORY", str(tmp_path))
+    monkeypatch.setitem(agent_registry.registry, mock_agent.identity.id, mock_agent)
+    return mock_agent
@@ -0,0 +1,142 @@
+"""Tests for the memory context."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import uuid4
+
+import orjson
+
+from swarmer.contexts.memory_context import MemoryContext, _encode_memory_id
+from swarmer.swarmer_types import AgentIdentity
+
+
+def test_context_instances_do_not_share_tools() -> None:
+    """Test that each context instance owns its own list of tools."""
+    first, second = MemoryContext(), MemoryContext()
+
+    assert first.tools is not second.tools
+    assert len(second.tools) == 4
+    assert all(bound_tool.__self__ is second for bound_tool in second.tools)
+
+
+def test_memory_ids_count_up_in_base62() -> None:
+    """Test that memory ids are consecutive base62 numbers per agent."""
+    assert [_encode_memory_id(n) for n in (0, 9, 10, 35, 36, 61, 62, 3843)] == [
+        "0",
+        "9",
+        "a",
+        "z",
+        "A",
+        "Z",
+        "10",
+        "ZZ",
+    ]
+
+    context = MemoryContext()
+    agent, other = AgentIdentity("agent", "user"), AgentIdentity("other", "user")
+    added = [context.add_memory(agent, f"fact {n}", 5) for n in range(3)]
+    assert [response.content["memory"]["id"] for response in added] == ["0", "1", "2"]
+    assert context.add_memory(other, "fact", 5).content["memory"]["id"] == "0"
+
+
+def test_memory_ids_skip_keys_already_in_use() -> None:
+    """Test that ids taken in a state saved without counters are skipped."""
+    legacy_id = uuid4().hex
+    memory = {"content": "old", "timestamp": 1, "importance": 5}
+    state = {
+        "id": "memory-context",
+        "agent_memories": {"agent-id": {"0": memory, "1": memory, legacy_id: memory}},
+    }
+    context = MemoryContext()
+    agent = AgentIdentity("agent", "user")
+    agent.id = "agent-id"
+    context.deserialize(state, agent)
+
+    response = context.add_memory(agent, "new", 5)
+
+    assert response.content["memory"]["id"] == "2"
+    assert set(context.agent_memories["agent-id"]) == {"0", "1", "2", legacy_id}
+
+
+def test_concurrent_adds_get_distinct_ids() -> None:
+    """Test that memories added from several threads never share an id."""
+    context = MemoryContext()
+    agent = AgentIdentity("agent", "user")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(
+            executor.map(
+                lambda n: context.add_memory(agent, f"fact {n}", 5), range(200)
+            )
+        )
+
+    ids = {response.content["memory"]["id"] for response in responses}
+    assert len(ids) == 200
+    assert len(context.agent_memories[agent.id]) == 200
+
+
+def test_legacy_float_timestamps_round_trip() -> None:
+    """Test that memories saved with float seconds load as integer nanoseconds."""
+    state = {
+        "id": "memory-context",
+        "agent_memories": {
+            "agent-id": {
+                "0": {"content": "old", "timestamp": 1700000000.5, "importance": 5},
+                "1": {
+                    "content": "new",
+                    "timestamp": 1700000001000000000,
+                    "importance": 7,
+                },
+            }
+        },
+    }
+    agent = AgentIdentity("agent", "user")
+    context = MemoryContext()
+    context.deserialize(state, agent)
+
+    memories = context.agent_memories["agent-id"]
+    assert memories["0"].timestamp == 1700000000500000000
+    assert memories["1"].timestamp == 1700000001000000000
+
+    # Saving and loading again keeps the converted values
+    restored = MemoryContext()
+    restored.deserialize(orjson.loads(orjson.dumps(context.serialize())), agent)
+    assert restored.agent_memories["agent-id"] == memories
+
+
+def test_get_context_during_update_does_not_keep_old_state(monkeypatch: Any) -> None:
+    """Test that a get_context call racing an update is not cached afterwards."""
+    context = MemoryContext()
+    identity = AgentIdentity("agent", "user")
+    memory_id = context.add_memory(identity, "Likes tea", 2).content["memory"]["id"]
+
+    real_time_ns = time.time_ns
+
+    def time_ns_reading_context() -> int:
+        # Runs while update_memory is part way through changing the memory
+        context.get_context(identity)
+        return real_time_ns()
+
+    monkeypatch.setattr(time, "time_ns", time_ns_reading_context)
+    revision = context.revision
+    context.update_memory(identity, memory_id, "Loves tea", importance=9)
+
+    assert context.get_context(identity)["memories"][1] == (
+        f"- Loves tea (ID: {memory_id}, Importance: 9)"
+    )
+    assert context.revision == revision + 1
+
+
+def test_serialized_state_is_plain_json() -> None:
+    """Test that the serialized state encodes with json and holds no live memories."""
+    context = MemoryContext()
+    agent = AgentIdentity("agent", "user")
+    memory_id = context.add_memory(agent, "Likes tea", 5).content["memory"]["id"]
+
+    state = json.loads(json.dumps(context.serialize()))
+    assert state["agent_memories"][agent.id][memory_id]["content"] == "Likes tea"
+
+    context.serialize()["agent_memories"][agent.id][memory_id]["content"] = "Changed"
+    assert context.agent_memories[agent.id][memory_id].content == "Likes tea"
@@ -0,0 +1,47 @@
+"""Tests for the persona context."""
+
+from swarmer.agent import Agent
+from swarmer.contexts.persona_context import PersonaContext
+from swarmer.instructions.instruction import Persona
+
+
+def test_create_persona_reuses_identical_persona(registered_agent: Agent) -> None:
+    """Test that recreating a persona keeps one switch tool and the new description."""
+    context = PersonaContext()
+    identity = registered_agent.identity
+
+    first = context.create_persona(identity, "Talk like a pirate", "Old", "pirate")
+    tool_count = len(registered_agent.tools)
+    second = context.create_persona(identity, "Talk like a pirate", "New", "pirate")
+
+    assert second.error is None
+    assert second.content["already_existed"] is True
+    switch_function = first.content["persona"]["switch_function"]
+    assert second.content["persona"]["switch_function"] == switch_function
+    assert second.content["persona"]["description"] == "New"
+    assert len(registered_agent.tools) == tool_count
+    assert len(context.persona_collection) == 1
+    (persona,) = context.persona_collection.values()
+    assert persona.description == "New"
+
+
+def test_deserialize_rekeys_personas_by_current_id(registered_agent: Agent) -> None:
+    """Test that personas saved under outdated ids are restored under their ids."""
+    persona_data = {
+        "instruction": "Talk like a pirate",
+        "description": "Arr",
+        "name": "pirate",
+    }
+    state = {
+        "id": "persona-context",
+        "persona_collection": {"outdated-sha256-id": persona_data},
+        "agent_persona": {registered_agent.identity.id: persona_data},
+    }
+    context = PersonaContext()
+    context.deserialize(state, registered_agent.identity)
+
+    persona_id = Persona(**persona_data).id
+    assert list(context.persona_collection) == [persona_id]
+    persona = context.persona_collection[persona_id]
+    assert context.get_active_persona(registered_agent.identity) is persona
+    assert context._switch_tool_name(persona) in registered_agent.tools
@@ -0,0 +1,115 @@
+"""Tests for the tool creation context."""
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import Any
+
+from swarmer.agent import Agent
+from swarmer.contexts import tool_creation_context
+from swarmer.contexts.tool_creation_context import (
+    ToolCreationContext,
+    _is_valid_tool_code,
+)
+
+_TOOL_CODE = '''
+@tool
+def shout(agent_identity: AgentIdentity, text: str) -> str:
+    """Shout the given text."""
+    return text{suffix}
+'''
+
+
+def _pyc_flags(file_path: Path) -> int:
+    """Read the invalidation flags from the cached bytecode of a source file."""
+    pyc = Path(importlib.util.cache_from_source(str(file_path)))
+    return int.from_bytes(pyc.read_bytes()[4:8], "little")
+
+
+def test_tool_lifecycle_keeps_files_and_agent_tools_in_sync(
+    registered_agent: Agent,
+) -> None:
+    """Test creating, updating and removing a tool on disk and on the agent."""
+    context = ToolCreationContext()
+    identity = registered_agent.identity
+    file_path = context.get_agent_tools_dir(identity.id) / "shout.py"
+    pyc_path = Path(importlib.util.cache_from_source(str(file_path)))
+
+    created = context.create_tool(identity, "shout", _TOOL_CODE.format(suffix=""))
+    assert created.error is None
+    assert file_path.exists()
+    # Bytecode is checked against a hash of the source, not its mtime
+    assert _pyc_flags(file_path) == 0b11
+    assert registered_agent.tools["shout"](identity, "Hey").content == "Hey"
+
+    updated = context.update_tool(
+        identity, "shout", _TOOL_CODE.format(suffix=".upper()")
+    )
+    assert updated.error is None
+    assert _pyc_flags(file_path) == 0b11
+    assert registered_agent.tools["shout"](identity, "Hey").content == "HEY"
+
+    removed = context.remove_tool(identity, "shout")
+    assert removed.error is None
+    assert not file_path.exists()
+    assert not pyc_path.exists()
+    assert "shout" not in registered_agent.tools
+    assert context.remove_tool(identity, "shout").error == "Tool 'shout' not found"
+
+
+def test_tools_named_unlike_their_file_are_unregistered(
+    registered_agent: Agent,
+) -> None:
+    """Test that updating and removing a file unregisters the tools it defined."""
+    context = ToolCreationContext()
+    identity = registered_agent.identity
+    code = _TOOL_CODE.format(suffix="")
+
+    context.create_tool(identity, "weather", code.replace("shout", "get_weather"))
+    assert "get_weather" in registered_agent.tools
+
+    context.update_tool(identity, "weather", code.replace("shout", "get_forecast"))
+    assert "get_weather" not in registered_agent.tools
+    assert "get_forecast" in registered_agent.tools
+
+    context.remove_tool(identity, "weather")
+    assert "get_forecast" not in registered_agent.tools
+
+
+def test_recreating_a_tool_runs_the_new_code(
+    registered_agent: Agent, monkeypatch: Any
+) -> None:
+    """Test that recreating a tool replaces it even if the file keeps its mtime."""
+    context = ToolCreationContext()
+    identity = registered_agent.identity
+    write_tool_file = tool_creation_context._write_tool_file
+
+    def write_with_fixed_mtime(file_path: Path, code: str) -> None:
+        write_tool_file(file_path, code)
+        os.utime(file_path, ns=(0, 1_700_000_000_000_000_000))
+
+    monkeypatch.setattr(
+        tool_creation_context, "_write_tool_file", write_with_fixed_mtime
+    )
+    context.create_tool(identity, "shout", _TOOL_CODE.format(suffix=".upper()"))
+    context.create_tool(identity, "shout", _TOOL_CODE.format(suffix=".lower()"))
+
+    assert registered_agent.tools["shout"](identity, "Hey").content == "hey"
+
+
+def test_tool_validation_is_cached_by_source(registered_agent: Agent) -> None:
+    """Test that resubmitting the same code reuses the validation result."""
+    context = ToolCreationContext()
+    identity = registered_agent.identity
+    code = _TOOL_CODE.format(suffix=".lower()")
+    _is_valid_tool_code.cache_clear()
+
+    context.create_tool(identity, "shout", code)
+    context.update_tool(identity, "shout", code)
+
+    cache_info = _is_valid_tool_code.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+    rejected = context.create_tool(identity, "unsafe", "@tool\ndef f(): eval('1')")
+    assert rejected.error is not None
+    assert "unsafe" not in context.list_available_tools(identity.id)
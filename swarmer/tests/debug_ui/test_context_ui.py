@@ -0,0 +1,34 @@
+"""Tests for the context debug UI components."""
+
+from swarmer.agent import Agent
+from swarmer.contexts.memory_context import MemoryContext
+from swarmer.contexts.persona_context import PersonaContext
+from swarmer.debug_ui.context_ui import MemoryContextUI, PersonaContextUI
+
+_SCRIPT = "<script>alert('x')</script> & more"
+_ESCAPED_SCRIPT = "&lt;script&gt;alert('x')&lt;/script&gt; &amp; more"
+
+
+def test_memory_view_escapes_memory_content(mock_agent: Agent) -> None:
+    """Test that memory content is escaped in the rendered view."""
+    context = MemoryContext()
+    context.add_memory(mock_agent.identity, _SCRIPT, 5)
+
+    html = MemoryContextUI(context).render()
+
+    assert "<script>" not in html
+    assert f'<div class="memory-content">{_ESCAPED_SCRIPT}</div>' in html
+
+
+def test_persona_view_escapes_persona_text(registered_agent: Agent) -> None:
+    """Test that persona instructions and descriptions are escaped."""
+    context = PersonaContext()
+    context.create_persona(
+        registered_agent.identity, _SCRIPT, f"Says {_SCRIPT}", "pirate"
+    )
+
+    html = PersonaContextUI(context).render()
+
+    assert "<script>" not in html
+    assert f'<div class="persona-content">{_ESCAPED_SCRIPT}</div>' in html
+    assert f"Description: Says {_ESCAPED_SCRIPT}<br>" in html
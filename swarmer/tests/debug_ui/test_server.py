@@ -0,0 +1,112 @@
+"""Tests for the debug UI server."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from swarmer.agent import Agent
+from swarmer.contexts.memory_context import MemoryContext
+from swarmer.contexts.persona_context import PersonaContext
+from swarmer.contexts.time_context import TimeContext
+from swarmer.debug_ui.server import DebugUIServer
+from swarmer.swarmer_types import Message
+
+
+@pytest.fixture
+def server(mock_agent: Agent) -> DebugUIServer:
+    """Create a debug server with an agent registered under user id 7."""
+    server = DebugUIServer()
+    server.agents[7] = mock_agent
+    return server
+
+
+def test_context_views_of_removed_contexts_are_dropped(
+    server: DebugUIServer, mock_agent: Agent
+) -> None:
+    """Test that cached views only cover the agent's current contexts."""
+    memory_context = MemoryContext()
+    persona_context = PersonaContext()
+    mock_agent.register_context(memory_context)
+    mock_agent.register_context(persona_context)
+    client = server.app.test_client()
+
+    assert client.get("/agent/7").status_code == 200
+    assert server._ui_cache[7].keys() == {memory_context.id, persona_context.id}
+
+    mock_agent.unregister_context(memory_context.id)
+    assert client.get("/agent/7").status_code == 200
+    assert server._ui_cache[7].keys() == {persona_context.id}
+
+
+def test_unchanged_page_is_answered_with_not_modified(
+    server: DebugUIServer, mock_agent: Agent
+) -> None:
+    """Test that revalidating an unchanged page returns 304 without building it."""
+    memory_context = MemoryContext()
+    mock_agent.register_context(memory_context)
+    client = server.app.test_client()
+    etag = client.get("/agent/7").headers["ETag"]
+
+    with patch.object(DebugUIServer, "_tools_view") as tools_view:
+        response = client.get("/agent/7", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    tools_view.assert_not_called()
+
+    memory_context.add_memory(mock_agent.identity, "Likes tea", 5)
+    response = client.get("/agent/7", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    mock_agent.clear_message_log()
+    response = client.get("/agent/7", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+def test_page_changes_when_only_the_current_context_does(
+    server: DebugUIServer, mock_agent: Agent, monkeypatch: Any
+) -> None:
+    """Test that a context changing without a version bump changes the ETag."""
+    clock = SimpleNamespace(time=lambda: 1_700_000_000.0)
+    monkeypatch.setattr("swarmer.contexts.time_context.time", clock)
+    mock_agent.register_context(TimeContext())
+    client = server.app.test_client()
+    etag = client.get("/agent/7").headers["ETag"]
+
+    clock.time = lambda: 1_700_000_001.2
+    response = client.get("/agent/7", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert "2023-11-14T22:13:21+00:00" in response.get_data(as_text=True)
+
+
+def test_page_shows_the_most_recent_messages_up_to_the_limit(
+    server: DebugUIServer, mock_agent: Agent
+) -> None:
+    """Test that only the last `limit` messages are shown, oldest first."""
+    mock_agent.message_log.extend(
+        Message(role="user", content=f"turn-{turn}") for turn in range(5)
+    )
+
+    page = server.app.test_client().get("/agent/7?limit=2").get_data(as_text=True)
+
+    assert "turn-0" not in page and "turn-2" not in page
+    assert page.index("turn-3") < page.index("turn-4")
+    assert "3 hidden" in page
+
+
+def test_streamed_page_shows_the_state_it_was_requested_in(
+    server: DebugUIServer, mock_agent: Agent
+) -> None:
+    """Test that the page streams snapshots, not the agent's live state."""
+    mock_agent.register_context(MemoryContext())
+    response = server.app.test_client().get("/agent/7", buffered=False)
+
+    # The agent keeps running while the page is being streamed
+    mock_agent.token_usage["total_tokens"] = 1234
+    mock_agent.register_context(PersonaContext())
+    page = response.get_data(as_text=True)
+
+    assert "Total tokens: 0" in page
+    assert "Memory Context" in page and "Persona Context" not in page
@@ -1,8 +1,18 @@
 """Tests for the agent module."""
 
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import patch
+
 from tests.conftest import MockContext
 
 from swarmer.agent import Agent
+from swarmer.swarmer_types import AgentIdentity, Message
+from swarmer.tools.utils import read_only, tool
 
 
 def test_agent_creation() -> None:
@@ -32,3 +42,326 @@ def test_agent_context_management(mock_context: MockContext) -> None:
     # Test context unregistration
     agent.unregister_context(mock_context.id)
     assert mock_context.id not in agent.contexts
+
+
+def _completion_response(message: Message, finish_reason: str = "stop") -> Any:
+    """Build a minimal stand-in for a litellm completion response."""
+    choice = SimpleNamespace(message=message, finish_reason=finish_reason)
+    return SimpleNamespace(choices=[choice], usage=None)
+
+
+def _tool_call_turn(name: str, labels: List[str]) -> List[Any]:
+    """Build completion responses that call a tool once per label, then stop."""
+    tool_calls = [
+        {
+            "id": f"call_{label}",
+            "type": "function",
+            "function": {"name": name, "arguments": json.dumps({"label": label})},
+        }
+        for label in labels
+    ]
+    return [
+        _completion_response(
+            Message(role="assistant", content=None, tool_calls=tool_calls),
+            finish_reason="tool_calls",
+        ),
+        _completion_response(Message(role="assistant", content="done")),
+    ]
+
+
+def test_run_loop_executes_read_only_tool_calls_concurrently(mock_agent: Agent) -> None:
+    """Test that read-only tool calls from one turn run in parallel in order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    @read_only
+    @tool
+    def wait_for_peer(agent_identity: AgentIdentity, label: str) -> str:
+        """Block until the other tool call is running too."""
+        barrier.wait()
+        return label
+
+    mock_agent.register_tool(wait_for_peer)
+    responses = _tool_call_turn("wait_for_peer", ["first", "second"])
+
+    with patch("swarmer.agent.completion", side_effect=responses):
+        history = mock_agent.run_loop("hello")
+
+    tool_messages = [message for message in history if message.role == "tool"]
+    assert [message.tool_call_id for message in tool_messages] == [
+        "call_first",
+        "call_second",
+    ]
+    assert [message.content for message in tool_messages] == ["first", "second"]
+    assert history[-1].content == "done"
+
+
+def test_run_loop_executes_mutating_tool_calls_in_order(mock_agent: Agent) -> None:
+    """Test that tool calls that may change state run one at a time in order."""
+    events: List[str] = []
+
+    @tool
+    def record(agent_identity: AgentIdentity, label: str) -> str:
+        """Record the start and end of the call."""
+        events.append(f"start {label}")
+        time.sleep(0.01)
+        events.append(f"end {label}")
+        return label
+
+    mock_agent.register_tool(record)
+    responses = _tool_call_turn("record", ["first", "second", "third"])
+
+    with patch("swarmer.agent.completion", side_effect=responses):
+        mock_agent.run_loop("hello")
+
+    assert events == [
+        "start first",
+        "end first",
+        "start second",
+        "end second",
+        "start third",
+        "end third",
+    ]
+
+
+def test_tool_schemas_cached_until_tools_change(mock_agent: Agent) -> None:
+    """Test that tool schemas are reused until a tool is (un)registered."""
+
+    @tool
+    def echo(agent_identity: AgentIdentity, text: str) -> str:
+        """Echo the given text."""
+        return text
+
+    mock_agent.register_tool(echo)
+    schemas = mock_agent.get_tool_schemas()
+    assert mock_agent.get_tool_schemas() is schemas
+
+    mock_agent.unregister_tool("echo")
+    assert mock_agent.get_tool_schemas() is None
+
+
+def test_register_tools_adds_all_tools(mock_agent: Agent) -> None:
+    """Test that registering tools in bulk adds each one under its name."""
+
+    @tool
+    def ping(agent_identity: AgentIdentity) -> str:
+        """Reply with pong."""
+        return "pong"
+
+    @tool
+    def pong(agent_identity: AgentIdentity) -> str:
+        """Reply with ping."""
+        return "ping"
+
+    mock_agent.register_tools([ping, pong])
+    assert mock_agent.tools["ping"] is ping
+    assert mock_agent.tools["pong"] is pong
+    assert len(mock_agent.get_tool_schemas() or []) == 2
+
+
+def test_save_and_load_state_round_trip(mock_agent: Agent, tmp_path: Path) -> None:
+    """Test that an agent's state survives a save/load round trip."""
+    mock_agent.message_log.extend(
+        [
+            Message(role="user", content="hello"),
+            Message(role="assistant", content="hi there"),
+        ]
+    )
+    mock_agent.token_usage["total_tokens"] = 42
+
+    state_file = tmp_path / "agent.json"
+    Agent.save_state(mock_agent, str(state_file))
+    loaded = Agent.load_state(str(state_file))
+
+    assert loaded.identity.id == mock_agent.identity.id
+    assert loaded.identity.name == "test_agent"
+    assert loaded.token_usage["total_tokens"] == 42
+    assert [(m.role, m.content) for m in loaded.message_log] == [
+        ("user", "hello"),
+        ("assistant", "hi there"),
+    ]
+
+
+def test_load_agent_tools_reuses_unchanged_modules(
+    mock_agent: Agent, tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Test that unchanged tool files are not re-executed on reload."""
+    monkeypatch.setenv("AGENT_TOOLS_DIRECTORY", str(tmp_path))
+
+    tools_dir = tmp_path / mock_agent.identity.id
+    tools_dir.mkdir()
+    (tools_dir / "shout.py").write_text(
+        "from swarmer.tools.utils import tool\n\n"
+        "@tool\n"
+        "def shout(agent_identity, text: str) -> str:\n"
+        '    """Shout the given text."""\n'
+        "    return text.upper()\n"
+    )
+
+    mock_agent.load_agent_tools()
+    first_tool = mock_agent.tools["shout"]
+    mock_agent.load_agent_tools()
+
+    assert mock_agent.tools["shout"] is first_tool
+
+
+def test_load_agent_tools_registers_tools_at_once(
+    mock_agent: Agent, tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Test that loading several tool files bumps the tools version once."""
+    monkeypatch.setenv("AGENT_TOOLS_DIRECTORY", str(tmp_path))
+
+    tools_dir = tmp_path / mock_agent.identity.id
+    tools_dir.mkdir()
+    for name in ("shout", "whisper"):
+        (tools_dir / f"{name}.py").write_text(
+            "from swarmer.tools.utils import tool\n\n"
+            "@tool\n"
+            f"def {name}(agent_identity, text: str) -> str:\n"
+            '    """Repeat the given text."""\n'
+            "    return text\n"
+        )
+    (tools_dir / "broken.py").write_text("raise RuntimeError('broken tool')\n")
+
+    version = mock_agent._tools_version
+    mock_agent.load_agent_tools()
+
+    assert {"shout", "whisper"} <= mock_agent.tools.keys()
+    assert mock_agent._tools_version == version + 1
+
+
+def test_run_loop_batch_uses_single_completion(mock_agent: Agent) -> None:
+    """Test that batched inputs are answered by one completion request."""
+    reply = Message(role="assistant", content='```json\n["one", "two"]\n```')
+
+    with patch(
+        "swarmer.agent.completion", return_value=_completion_response(reply)
+    ) as mock_completion:
+        results = mock_agent.run_loop_batch(["first?", "second?"])
+
+    assert mock_completion.call_count == 1
+    assert [[m.content for m in history] for history in results] == [
+        ["one"],
+        ["two"],
+    ]
+    assert [(m.role, m.content) for m in mock_agent.message_log] == [
+        ("user", "first?"),
+        ("assistant", "one"),
+        ("user", "second?"),
+        ("assistant", "two"),
+    ]
+
+
+def test_run_loop_batch_falls_back_to_individual_runs(mock_agent: Agent) -> None:
+    """Test that an unusable batched reply falls back to one run per input."""
+    responses = [
+        _completion_response(Message(role="assistant", content="not json")),
+        _completion_response(Message(role="assistant", content="one")),
+        _completion_response(Message(role="assistant", content="two")),
+    ]
+
+    with patch("swarmer.agent.completion", side_effect=responses):
+        results = mock_agent.run_loop_batch(["first?", "second?"])
+
+    assert [history[-1].content for history in results] == ["one", "two"]
+
+
+def test_run_loop_without_context_skips_context_message(mock_agent: Agent) -> None:
+    """Test that no context message is sent when the mock_agent has no context."""
+    reply = Message(role="assistant", content="hi")
+
+    with patch(
+        "swarmer.agent.completion", return_value=_completion_response(reply)
+    ) as mock_completion:
+        mock_agent.run_loop("hello")
+
+    messages = mock_completion.call_args.kwargs["messages"]
+    assert [m.role for m in messages] == ["system", "user"]
+
+
+def test_message_log_is_trimmed_at_turn_boundaries(mock_agent: Agent) -> None:
+    """Test that old turns are dropped once the message log is too long."""
+
+    with patch("swarmer.agent._MAX_HISTORY_MESSAGES", 4):
+        for turn in range(3):
+            reply = Message(role="assistant", content=f"reply {turn}")
+            with patch(
+                "swarmer.agent.completion", return_value=_completion_response(reply)
+            ):
+                mock_agent.run_loop(f"input {turn}")
+
+    assert [m.content for m in mock_agent.message_log] == [
+        "input 1",
+        "reply 1",
+        "input 2",
+        "reply 2",
+    ]
+
+
+def test_message_log_keeps_a_single_turn_longer_than_the_limit(
+    mock_agent: Agent,
+) -> None:
+    """Test that trimming never drops the latest turn, however long it is."""
+    long_turn = [Message(role="user", content="input 1")] + [
+        Message(role="assistant", content=f"step {step}") for step in range(5)
+    ]
+    mock_agent.message_log.extend(
+        [
+            Message(role="user", content="input 0"),
+            Message(role="assistant", content="reply 0"),
+            *long_turn,
+        ]
+    )
+
+    with patch("swarmer.agent._MAX_HISTORY_MESSAGES", 4):
+        mock_agent._trim_message_log()
+
+    assert list(mock_agent.message_log) == long_turn
+
+
+def test_context_rebuilt_only_after_mutating_tools(
+    mock_agent: Agent, mock_context: MockContext
+) -> None:
+    """Test that read-only tool rounds reuse the context of the previous request."""
+    mock_agent.register_context(mock_context)
+
+    @read_only
+    @tool
+    def peek(agent_identity: AgentIdentity) -> str:
+        """Look without changing anything."""
+        return "peeked"
+
+    @tool
+    def poke(agent_identity: AgentIdentity) -> str:
+        """Change something."""
+        return "poked"
+
+    mock_agent.register_tool(peek)
+    mock_agent.register_tool(poke)
+
+    def tool_call_response(name: str) -> Any:
+        tool_call = {
+            "id": f"call_{name}",
+            "type": "function",
+            "function": {"name": name, "arguments": "{}"},
+        }
+        return _completion_response(
+            Message(role="assistant", content=None, tool_calls=[tool_call]),
+            finish_reason="tool_calls",
+        )
+
+    responses = [
+        tool_call_response("peek"),
+        tool_call_response("poke"),
+        _completion_response(Message(role="assistant", content="done")),
+    ]
+
+    with (
+        patch("swarmer.agent.completion", side_effect=responses),
+        patch.object(
+            MockContext, "get_context", autospec=True, return_value={"message": "ctx"}
+        ) as mock_get_context,
+    ):
+        mock_agent.run_loop("hello")
+
+    # Once for the initial request, once after the mutating "poke" round
+    assert mock_get_context.call_count == 2
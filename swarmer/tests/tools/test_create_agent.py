@@ -0,0 +1,20 @@
+"""Tests for the create_agent tool."""
+
+from typing import Any
+
+from swarmer.globals.agent_registry import agent_registry
+from swarmer.swarmer_types import AgentIdentity
+from swarmer.tools.create_agent import create_agent
+
+
+def test_create_agent_registers_new_agent_under_its_own_id(monkeypatch: Any) -> None:
+    """Test that the created agent is registered without replacing its creator."""
+    # Register into a copy, so the created agent is dropped after the test
+    monkeypatch.setattr(agent_registry, "registry", dict(agent_registry.registry))
+    creator = AgentIdentity("creator", "test_user")
+
+    result = create_agent(creator, "child", 1000, "gpt-3.5-turbo")
+
+    child = agent_registry.registry[result.content]
+    assert child.identity.name == "child"
+    assert creator.id not in agent_registry.registry
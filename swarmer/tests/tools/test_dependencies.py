@@ -0,0 +1,31 @@
+"""Tests for the tool dependency handling."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from swarmer.tools import dependencies
+from swarmer.tools.dependencies import ensure_dependencies
+
+
+def test_concurrent_calls_install_missing_packages_once(monkeypatch: Any) -> None:
+    """Test that concurrent tool calls never run pip install side by side."""
+    installs: List[List[str]] = []
+    running = threading.Lock()
+
+    def check_call(command: List[str]) -> None:
+        assert running.acquire(blocking=False), "pip ran concurrently"
+        time.sleep(0.05)
+        installs.append(command)
+        running.release()
+
+    monkeypatch.setattr(dependencies.subprocess, "check_call", check_call)
+    monkeypatch.setattr(dependencies, "_installed", set())
+
+    requirement = [("swarmer-missing-package", None)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: ensure_dependencies(requirement), range(4)))
+
+    assert len(installs) == 1
+    assert installs[0][-1] == "swarmer-missing-package"
@@ -0,0 +1,79 @@
+"""Tests for the tool module loader."""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from swarmer.tools.loader import load_tool_module, module_tool_names
+
+_TOOL_SOURCE = (
+    "from swarmer.tools.utils import tool\n\n"
+    "@tool\n"
+    "def shout(agent_identity, text: str) -> str:\n"
+    '    """Shout the given text."""\n'
+    "    return text{suffix}\n"
+)
+
+
+@pytest.fixture
+def tool_file(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Write a tool file and drop its module from sys.modules afterwards."""
+    monkeypatch.delitem(sys.modules, "loader_test.shout", raising=False)
+    file_path = tmp_path / "shout.py"
+    file_path.write_text(_TOOL_SOURCE.format(suffix=".upper()"))
+    return file_path
+
+
+def test_unchanged_file_reuses_module(tool_file: Path) -> None:
+    """Test that an unchanged tool file is only executed once."""
+    module = load_tool_module("loader_test.shout", tool_file)
+
+    assert load_tool_module("loader_test.shout", tool_file) is module
+    assert module_tool_names(module) == ["shout"]
+
+
+def test_changed_file_is_executed_again(tool_file: Path) -> None:
+    """Test that a modified tool file is executed again."""
+    module = load_tool_module("loader_test.shout", tool_file)
+
+    tool_file.write_text(_TOOL_SOURCE.format(suffix=".lower()"))
+    # Move the mtime back to check any change is noticed, not only newer ones
+    stat = tool_file.stat()
+    os.utime(tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    reloaded = load_tool_module("loader_test.shout", tool_file)
+
+    assert reloaded is not module
+    assert reloaded.shout("agent-id", "Hey").content == "hey"
+
+
+def test_rewrite_keeping_the_mtime_is_executed_again(tool_file: Path) -> None:
+    """Test that a resized file keeping its mtime is executed again."""
+    module = load_tool_module("loader_test.shout", tool_file)
+    stat = tool_file.stat()
+
+    tool_file.write_text(_TOOL_SOURCE.format(suffix=".title() + '!'"))
+    os.utime(tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    reloaded = load_tool_module("loader_test.shout", tool_file)
+
+    assert reloaded is not module
+    assert reloaded.shout("agent-id", "hey there").content == "Hey There!"
+
+
+def test_evicted_module_is_executed_again(tool_file: Path) -> None:
+    """Test that removing a module from sys.modules forces it to be executed."""
+    module = load_tool_module("loader_test.shout", tool_file)
+    del sys.modules["loader_test.shout"]
+
+    assert load_tool_module("loader_test.shout", tool_file) is not module
+
+
+def test_failed_load_leaves_no_module(tool_file: Path) -> None:
+    """Test that a tool file that raises is not left in sys.modules."""
+    tool_file.write_text("raise RuntimeError('broken tool')\n")
+
+    with pytest.raises(RuntimeError):
+        load_tool_module("loader_test.shout", tool_file)
+    assert "loader_test.shout" not in sys.modules
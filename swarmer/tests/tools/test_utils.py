@@ -59,3 +59,19 @@ def test_tool_documentation() -> None:
         return "Documentation preserved"
 
     assert documented_tool.__tool_doc__ == "Define a documented tool."
+
+
+def test_method_schema_skips_self_and_agent_identity() -> None:
+    """Verify that tool methods only list their own parameters as required."""
+
+    class Sample:
+        @tool
+        def method_tool(
+            self, agent_identity: str, query: str, limit: int = 5
+        ) -> ToolResponse:
+            """Define a tool method."""
+            return ToolResponse(summary=query, content=None, error=None)
+
+    parameters = Sample.method_tool.__tool_schema__["function"]["parameters"]
+    assert list(parameters["properties"]) == ["query", "limit"]
+    assert parameters["required"] == ["query"]